@@ -290,9 +290,7 @@ class Model(ABC):
             return json.load(file)
 
     def write_meta(self, meta: Dict[str, Any]):
-        # noinspection PyTypeChecker
-        with open(self._meta_json, mode='w') as file:
-            json.dump(meta, file, indent=8)
+        write_json(self._meta_json, meta)
 
     def __repr__(self) -> str:
         """ Returns the folder path."""
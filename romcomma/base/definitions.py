@@ -31,6 +31,8 @@ import gpflow as gf
 import romcomma.gpf as mf
 import pandas as pd
 from abc import abstractmethod
+import json
+import os
 
 
 EFFECTIVELY_ZERO = 1.0E-64  #: Tolerance when testing floats for equality.
@@ -46,6 +48,22 @@ def FLOAT() -> Type:
     return gf.config.default_float()
 
 
+def write_json(path: Path, obj: Any):
+    """ Write obj to path as json, atomically.
+
+    The json is written to a temporary file, which then replaces path rather than overwriting it.
+    So readers never see a partly written file, and hard links to the old path are left intact.
+
+    Args:
+        path: The json file to write.
+        obj: The json serializable object to write.
+    """
+    temp = Path(path).with_suffix('.tmp')
+    with open(temp, mode='w') as file:
+        json.dump(obj, file, indent=8)
+    os.replace(temp, path)
+
+
 # noinspection PyPep8Naming
 class NP:
     """ Extended numpy types."""
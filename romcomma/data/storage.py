@@ -26,13 +26,21 @@ from __future__ import annotations
 import numpy as np
 
 from romcomma.base.definitions import *
-from copy import deepcopy
-import itertools
-import random
 import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum, auto
 import scipy.stats
+import scipy.special
 import json
+try:
+    from numba import njit
+except ImportError:     # Numba is optional, merely accelerating Normalization.
+    njit = None
+try:
+    import pyarrow
+except ImportError:     # PyArrow is optional, merely accelerating Frame reads, unless parquet files are used.
+    pyarrow = None
 
 
 
@@ -45,6 +53,18 @@ class Frame:
         """ The default options (kwargs) to pass to pandas.pd.read_csv."""
         return {'sep': ',', 'header': [0, 1], 'index_col': 0, }
 
+    @classmethod
+    @property
+    def PARQUET_OPTIONS(cls) -> Dict[str, Any]:
+        """ The default options (kwargs) to pass to pandas.DataFrame.to_parquet and pandas.read_parquet."""
+        return {'engine': 'pyarrow', }
+
+    @classmethod
+    @property
+    def TO_CSV_OPTIONS(cls) -> Dict[str, Any]:
+        """ The default options (kwargs) to pass to pandas.DataFrame.to_csv. Floats are left to pandas' default (shortest repr) for speed."""
+        return {'lineterminator': '\n', }
+
     @property
     def csv(self) -> Path:
         return self._csv
@@ -54,10 +74,50 @@ class Frame:
         """ Defines the empty Frame as that having an empty Path."""
         return 0 == len(self._csv.parts)
 
+    @property
+    def is_parquet(self) -> bool:
+        """ Whether this Frame is backed by a ``.parquet`` file, rather than a csv."""
+        return self._csv.suffix == '.parquet'
+
     def write(self):
-        """ Write to csv, according to Frame.CSV_OPTIONS."""
+        """ Write to csv, according to Frame.CSV_OPTIONS, or to parquet (snappy compressed) if ``self.is_parquet``."""
         assert not self.is_empty, 'Cannot write when frame.is_empty.'
-        self.df.to_csv(path_or_buf=self._csv, sep=Frame.CSV_OPTIONS['sep'], index=True)
+        if self.is_parquet:
+            self.df.to_parquet(self._csv, compression='snappy', index=True, **Frame.PARQUET_OPTIONS)
+        elif (self.df.index.dtype.kind == 'i' and all(dtype == np.float64 for dtype in self.df.dtypes)
+              and not np.isnan(values := self.df.to_numpy()).any()):
+            # pandas writes the header, np.savetxt writes the body byte-for-byte as pandas would, but faster.
+            # ``'%s'`` is the shortest repr only for float64: narrower floats would be widened first, so they are left to pandas.
+            self.df.iloc[:0].to_csv(path_or_buf=self._csv, sep=Frame.CSV_OPTIONS['sep'], index=True, **Frame.TO_CSV_OPTIONS)
+            with open(self._csv, mode='a') as file:
+                np.savetxt(file, np.column_stack((self.df.index.to_numpy(), values)), fmt=['%d'] + ['%s'] * values.shape[1],
+                           delimiter=Frame.CSV_OPTIONS['sep'], newline=Frame.TO_CSV_OPTIONS['lineterminator'])
+        else:
+            self.df.to_csv(path_or_buf=self._csv, sep=Frame.CSV_OPTIONS['sep'], index=True, **Frame.TO_CSV_OPTIONS)
+
+    def _read_csv(self, **kwargs) -> pd.DataFrame:
+        """ Read csv, with the multithreaded pyarrow engine if possible, which is faster and parses floats exactly.
+
+        Args:
+            kwargs: The options to pass to pandas.read_csv. The pyarrow engine cannot read a multi-row header, which is read separately,
+                so it is used only for the options ``sep``, ``header=[0, ..., n]`` and ``index_col=0``.
+        Returns: The pd.DataFrame read.
+        """
+        header = kwargs.get('header', 0)
+        header = [header] if isinstance(header, int) else header
+        if pyarrow is None or set(kwargs) - {'sep', 'header', 'index_col'} or kwargs.get('index_col') != 0 or header != list(range(len(header))):
+            return pd.read_csv(self._csv, **kwargs)
+        columns = pd.read_csv(self._csv, nrows=0, **kwargs)
+        if columns.index.name is not None:      # An index name occupies an extra header row.
+            return pd.read_csv(self._csv, **kwargs)
+        try:
+            df = pd.read_csv(self._csv, engine='pyarrow', sep=kwargs.get('sep', ','), header=None, skiprows=len(header), index_col=0)
+        except pyarrow.ArrowInvalid:    # pyarrow rejects a header with no body, which pandas reads as an empty (0, n) pd.DataFrame.
+            return pd.read_csv(self._csv, **kwargs)
+        strings = df.columns[df.dtypes == object]
+        df[strings] = df[strings].where(df[strings].notna(), np.nan)     # pyarrow reads empty strings as None, pandas as NaN.
+        df.index.name, df.columns = None, columns.columns
+        return df
 
     def __repr__(self) -> str:
         return str(self._csv)
@@ -70,19 +130,20 @@ class Frame:
         """ Initialize Frame.
 
         Args:
-            csv: The csv file.
+            csv: The csv file. A ``.parquet`` suffix backs the Frame by a parquet file instead.
             df: The initial data. If this is empty, it is read from csv, otherwise it overwrites (or creates) csv.
         Keyword Args:
             kwargs: Updates Frame.CSV_OPTIONS for csv reading as detailed in
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.read_csv.html.
-                This is not relevant to writing, which just uses Frame.CSV_OPTIONS.
+                This is not relevant to writing, which just uses Frame.CSV_OPTIONS, nor to parquet files.
         """
         self._csv = Path(csv)
         if self.is_empty:
             assert df.empty, 'csv is an empty path, but df is not an empty pd.DataFrame.'
             self.df = df
         elif df.empty:
-            self.df = pd.read_csv(self._csv, **{**Frame.CSV_OPTIONS, **kwargs})
+            self.df = (pd.read_parquet(self._csv, **Frame.PARQUET_OPTIONS) if self.is_parquet
+                       else self._read_csv(**{**Frame.CSV_OPTIONS, **kwargs}))
         else:
             self.df = df
             self.write()
@@ -92,43 +153,74 @@ class Repository:
     """ A ``repo`` object is defined as a folder containing a ``data.csv`` file and a ``meta.json`` file.
 
     These files specify the global dataset to be analyzed. This dataset must be further split into Folds contained within the Repository.
+    Setting ``meta['format'] = 'parquet'`` stores ``data.parquet`` instead of ``data.csv``, and this is inherited by every Fold.
     """
 
+    @property
+    def format(self) -> str:
+        """ The file format backing the data, either ``'csv'`` (the default) or ``'parquet'``."""
+        return self._meta.get('format', 'csv')
+
+    @property
+    def _csv(self) -> Path:
+        return self._folder / f'data.{self.format}'
+
     @property
     def folder(self) -> Path:
         return self._folder
 
     @property
     def data(self) -> Frame:
+        """ The data, read on first access if necessary."""
+        self._data = Frame(self._csv) if self._data is None else self._data
         return self._data
 
+    def _under_heading(self, df: pd.DataFrame, heading: str) -> pd.DataFrame:
+        """ Select ``df[heading]`` from a view of ``df.to_numpy()``, caching the position and sub-headings of heading on first use.
+
+        Args:
+            df: A pd.DataFrame with the MultiIndex columns of ``self.data``.
+            heading: The heading to select, usually ``self.meta['data']['X_heading']`` or ``self.meta['data']['Y_heading']``.
+        Returns: The columns of df under heading, headed by their sub-headings.
+        """
+        if heading not in self._headings:
+            self._headings[heading] = df.columns.get_loc(heading), df[heading].columns
+        loc, columns = self._headings[heading]
+        return pd.DataFrame(df.to_numpy()[:, loc], index=df.index, columns=columns, copy=False)
+
     @property
     def X(self) -> pd.DataFrame:
         """ The input X, as an (N,M) design Matrix with column headings."""
-        return self._data.df[self._meta['data']['X_heading']]
+        return self._under_heading(self.data.df, self._meta['data']['X_heading'])
 
     @property
     def Y(self) -> pd.DataFrame:
         """ The output Y as an (N,L) Matrix with column headings."""
-        return self._data.df[self._meta['data']['Y_heading']]
+        return self._under_heading(self.data.df, self._meta['data']['Y_heading'])
 
     def read_meta(self) -> Dict[str, Any]:
         with open(self._meta_json, mode='r') as file:
             return json.load(file)
 
     def write_meta(self):
-        with open(self._meta_json, mode='w') as file:
-            json.dump(self._meta, file, indent=8)
+        write_json(self._meta_json, self._meta)
 
     @property
     def meta(self) -> Dict[str, Any]:
         return self._meta
 
-    def _update_meta(self):
-        self._meta.update({'data': {'X_heading': self._data.df.columns.values[0][0],
-                                    'Y_heading': self._data.df.columns.values[-1][0]}})
-        self._meta['data'].update({'N': self.data.df.shape[0], 'M': self.X.shape[1],
-                                   'L': self.Y.shape[1]})
+    def _update_meta(self, df: pd.DataFrame | None = None, N: int | None = None):
+        """ Update and write the data meta.
+
+        Args:
+            df: The data, or any leading rows of it, from which to read the headings. Defaults to ``self.data.df``.
+            N: The number of rows. Defaults to ``df.shape[0]``.
+        """
+        df = self.data.df if df is None else df
+        self._meta.update({'data': {'X_heading': df.columns.values[0][0],
+                                    'Y_heading': df.columns.values[-1][0]}})
+        self._meta['data'].update({'N': df.shape[0] if N is None else N, 'M': df[self._meta['data']['X_heading']].shape[1],
+                                   'L': df[self._meta['data']['Y_heading']].shape[1]})
         self.write_meta()
 
     @property
@@ -159,7 +251,8 @@ class Repository:
         else:
             return range(self.K + (1 if self.meta['has_improper_fold'] else 0))
 
-    def into_K_folds(self, K: int, shuffle_before_folding: bool = False, normalization: Optional[Path | str] = None, is_normalization_applicable: bool = True) -> Repository:
+    def into_K_folds(self, K: int, shuffle_before_folding: bool = False, normalization: Optional[Path | str] = None, is_normalization_applicable: bool = True,
+                     seed: int | None = None, stratify: int | None = None) -> Repository:
         """ Fold this repo into K Folds, indexed by range(K).
 
         Args:
@@ -169,55 +262,84 @@ class Repository:
             shuffle_before_folding: Whether to shuffle the data before sampling.
             normalization: An optional normalization.csv file to use.
             is_normalization_applicable: Whether normalization is applicable. ``False`` means that normalization whatsoever will be applied.
+            seed: The seed for the random number generator which shuffles and folds the data. If None, fresh entropy is drawn.
+                Either way, the seed is recorded in ``self.meta['seed']`` so that the folding can be reproduced.
+            stratify: The (positional) column of data to stratify the Folds on, usually an output. If given, the data are ranked on this column
+                before being dealt into Folds, so that each Fold spans the whole range (or every category) of the column. If None, Folding is random.
         Returns: ``self``, for chaining calls.
         Raises:
-            IndexError: Unless 1 &lt= K &lt= N.
+            IndexError: Unless 1 &lt= K &lt= N, and stratify is None or a column of data.
         """
         data = self.data.df
         N = data.shape[0]
         if not (1 <= abs(K) <= N):
             raise IndexError(f'K={K:d} does not lie between 1 and N={N:d} inclusive.')
-        for k in range(max(abs(K), self.K) + 1):
-            shutil.rmtree(self.fold_folder(k), ignore_errors=True)
-        index = list(range(N))
+        if not (stratify is None or -data.shape[1] <= stratify < data.shape[1]):
+            raise IndexError(f'stratify={stratify:d} is not a column of data, which has {data.shape[1]:d} columns.')
+        stale = [folder for k in range(max(abs(K), self.K) + 1) if (folder := self.fold_folder(k)).exists()]
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as executor:
+                tuple(executor.map(lambda folder: shutil.rmtree(folder, ignore_errors=True), stale))
+        seed = np.random.SeedSequence().entropy if seed is None else seed
+        rng = np.random.default_rng(seed)
+        index = np.arange(N, dtype=np.int64)
         if shuffle_before_folding:
-            random.shuffle(index)
-        self._meta.update({'K': abs(K), 'shuffle before folding': shuffle_before_folding, 'has_improper_fold': K > 0})
+            rng.shuffle(index)
+        self._meta.update({'K': abs(K), 'shuffle before folding': shuffle_before_folding, 'has_improper_fold': K > 0, 'seed': seed,
+                           'stratify': stratify})
         self.write_meta()
         normalization = Normalization(self, self._data.df).csv if normalization is None else normalization
-        if K > 0:
-            Fold.from_dfs(parent=self, k=K, data=data.iloc[index], test_data=data.iloc[index], normalization=normalization,
-                          is_normalization_applicable=is_normalization_applicable)
-        K = abs(K)
-        K_blocks = [list(range(K)) for dummy in range(int(N / K))]
-        K_blocks.append(list(range(N % K)))
-        for K_range in K_blocks:
-            random.shuffle(K_range)
-        indicator = list(itertools.chain(*K_blocks))
-        for k in range(K):
-            indicated = tuple(zip(index, indicator))
-            data_index = [index for index, indicator in indicated if k != indicator]
-            test_index = [index for index, indicator in indicated if k == indicator]
-            data_index = test_index if data_index == [] else data_index
-            Fold.from_dfs(parent=self, k=k, data=data.iloc[data_index], test_data=data.iloc[test_index], normalization=normalization,
-                          is_normalization_applicable=is_normalization_applicable)
+        values = data.to_numpy()
+
+        def rows(positions: NP.Array) -> pd.DataFrame:
+            """ Gather the rows of data at positions, straight from the underlying ndarray."""
+            return pd.DataFrame(values.take(positions, axis=0), index=data.index.take(positions), columns=data.columns, copy=False)
+
+        has_improper_fold, K = K > 0, abs(K)
+        blocks = np.tile(np.arange(K, dtype=np.int64), (N // K, 1))     # Each row is a block of K consecutive data, dealt one per Fold.
+        rng.permuted(blocks, axis=1, out=blocks)
+        indicator = np.concatenate([blocks.ravel(), rng.permutation(N % K)])
+        if stratify is not None:
+            # Deal the indicator along the ranking of data[index, stratify], so each block of K similar values spans all K Folds.
+            ranked = np.argsort(values[index, stratify], kind='stable')
+            indicator[ranked] = indicator.copy()
+        masks = (indicator == np.arange(K, dtype=np.int64)[:, np.newaxis])     # masks[k] flags the test rows of Fold k.
+        indices = [(k, index[mask] if K == 1 else index[~mask], index[mask]) for k, mask in enumerate(masks)]
+        indices += [(K, index, index)] if has_improper_fold else []
+
+        def from_dfs(k: int, data_index: NP.Array, test_index: NP.Array) -> Fold:
+            data_k = rows(data_index)
+            return Fold.from_dfs(parent=self, k=k, data=data_k, test_data=data_k if test_index is data_index else rows(test_index),
+                                 normalization=normalization, is_normalization_applicable=is_normalization_applicable)
+
+        # Each Fold is written to its own folder. Threads suffice, as normalization (ndtri and the Numba kernels) releases the GIL.
+        with ThreadPoolExecutor(max_workers=min(len(indices), os.cpu_count() or 1)) as executor:
+            tuple(executor.map(from_dfs, *zip(*indices)))
         return self
 
     def rotate_folds(self, rotation: NP.Matrix | None) -> Repository:
         """ Uniformly rotate the Folds in a Repository. The rotation (like normalization) applies to each fold, not the repo itself.
 
         Args:
-            rotation: The (M,M) rotation matrix to apply to the inputs. If None, the identity matrix is used.
+            rotation: The (M,M) rotation matrix to apply to the inputs. If None, the identity matrix is used, which leaves the Folds untouched.
             If the matrix supplied has the wrong dimensions or is not orthogonal, a random rotation is generated and used instead.
         Returns: ``self``, for chaining calls.
         """
-        M = self.M
         if rotation is None:
-            rotation = np.eye(M)
-        elif rotation.shape != (M, M) or not np.allclose(np.dot(rotation, rotation.T), np.eye(M)):
+            return self
+        M = self.M
+        if rotation.shape == (M, M):
+            error = np.matmul(np.transpose(rotation), rotation)
+            error[np.diag_indices(M)] -= 1
+        if rotation.shape != (M, M) or np.amax(np.abs(error)) > 1.0E-8:
             rotation = scipy.stats.special_ortho_group.rvs(M)
-        for k in self.folds:
+
+        def rotate(k: int):
             Fold(self, k).X_rotation = rotation
+
+        # Each Fold rewrites only its own files, so the Folds are rotated concurrently, as in into_K_folds.
+        with ThreadPoolExecutor(max_workers=max(1, min(len(self.folds), os.cpu_count() or 1))) as executor:
+            tuple(executor.map(rotate, self.folds))
         return self
 
     def fold_folder(self, k: int) -> Path:
@@ -236,11 +358,8 @@ class Repository:
             if not destination.exists():
                 destination.mkdir(mode=0o777, parents=True, exist_ok=False)
             indices = np.append(range(self.M), self.M + l)
-            data = self.data.df.take(indices, axis=1, is_copy=True)
-            Frame(destination / self._csv.name, data)
-            meta = deepcopy(self._meta)
-            meta['data']['L'] = 1
-            Repository.from_df(destination, data, meta)
+            data = self.data.df.take(indices, axis=1)
+            Repository.from_df(destination, data, self._meta | {'data': self._meta['data'] | {'L': 1}})
 
     @property
     def Y_splits(self) -> List[Tuple[int, Path]]:
@@ -262,8 +381,8 @@ class Repository:
     def __init__(self, folder: Path | str, **kwargs):
         self._folder = Path(folder)
         self._meta_json = self._folder / 'meta.json'
-        self._csv = self._folder / 'data.csv'
         self._data = None
+        self._headings = {}
         init_mode = kwargs.get('init_mode', Repository._InitMode.READ)
         if init_mode <= Repository._InitMode.READ:
             self._meta = self.read_meta()
@@ -276,7 +395,7 @@ class Repository:
     @classmethod
     @property
     def META(cls) -> Dict[str, Any]:
-        return {'csv_kwargs': Frame.CSV_OPTIONS, 'data': {}, 'K': 0, 'shuffle before folding': False}
+        return {'csv_kwargs': Frame.CSV_OPTIONS, 'format': 'csv', 'data': {}, 'K': 0, 'shuffle before folding': False}
 
     @classmethod
     def from_df(cls, folder: Path | str, df: pd.DataFrame, meta: Dict | None = None) -> Repository:
@@ -300,7 +419,7 @@ class Repository:
         return {'skiprows': None, 'index_col': 0}
 
     @classmethod
-    def from_csv(cls, folder: Path | str, csv: Path | str, PCA: bool = False, meta: Dict = None, **kwargs) -> Repository:
+    def from_csv(cls, folder: Path | str, csv: Path | str, PCA: bool = False, meta: Dict = None, chunksize: int | None = None, **kwargs) -> Repository:
         """ Create a Repository from a csv file.
 
         Args:
@@ -308,35 +427,43 @@ class Repository:
             csv: The file containing the data to record in [Return].csv.
             PSA: Whether to create a single fold in which Principal Component Analysis (PCA) has been performed on the inputs.
             meta: The metadata to record in [Return].meta.json.
+            chunksize: If not None, the csv file is streamed into the Repository this many rows at a time, and the data
+                are not read into memory until first required. This only applies to the (default) csv format.
             kwargs: Updates Repository.CSV_OPTIONS for reading the csv file, as detailed in
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.pd.read_csv.html.
         Returns: A new Repository located in folder.
         """
         csv = Path(csv)
         origin_csv_kwargs = cls.CSV_OPTIONS | kwargs
-        data = Frame(csv, **origin_csv_kwargs)
         meta = cls.META if meta is None else cls.META | meta
         meta['origin'] = {'csv': str(csv.absolute()), 'origin_csv_kwargs': origin_csv_kwargs}
-        repo = cls.from_df(folder, data.df, meta)
+        if chunksize is None or meta['format'] != 'csv':
+            repo = cls.from_df(folder, Frame(csv, **origin_csv_kwargs).df, meta)
+        else:
+            repo = Repository(folder, init_mode=Repository._InitMode.CREATE)
+            repo._meta = meta
+            N = 0
+            with pd.read_csv(csv, chunksize=chunksize, **{**Frame.CSV_OPTIONS, **origin_csv_kwargs}) as chunks:
+                for chunk in chunks:
+                    if N == 0:
+                        head = chunk
+                    chunk.to_csv(path_or_buf=repo._csv, sep=Frame.CSV_OPTIONS['sep'], index=True, mode='a', header=(N == 0),
+                                 **Frame.TO_CSV_OPTIONS)
+                    N += chunk.shape[0]
+            repo._update_meta(head, N)
         if PCA:
             repo = repo.into_K_folds(-1)
-            fold = Repository(repo.fold_folder(0))
-            X = fold.X.values
-            print(f'pre mean = {np.mean(fold.X.values, axis=0)}')  # DEBUG:
-            cov = np.cov(X, rowvar=False)
-            eigenvalues, eigenvectors = np.linalg.eigh(cov)
-            idx = eigenvalues.argsort()[::-1]
-            eigenvalues = eigenvalues[idx]
-            eigenvectors = eigenvectors[:, idx]
-            cov = np.einsum('ij,ij->j', eigenvectors, eigenvectors)
-
-            repo = repo.rotate_folds(eigenvectors.T)
+            fold = Fold(repo, 0)
+            M = fold.M
+            X = fold.data.df.to_numpy()[:, :M]
+            _, singular_values, eigenvectors = np.linalg.svd(X - np.mean(X, axis=0, keepdims=True), full_matrices=False)
+            eigenvalues = singular_values ** 2 / (X.shape[0] - 1)     # Singular values are returned in descending order.
+            eigenvectors = eigenvectors.T
+            fold.X_rotation = eigenvectors.T
             # Test Code
-            fold = Fold(repo,0)
-            fold.data.df.iloc[:, :fold.M] /= np.sqrt(eigenvalues)
-            fold.test_data.df.iloc[:, :fold.M] /= np.sqrt(eigenvalues)
-            print(f'post mean = {np.mean(fold.X.values, axis=0)}')  # DEBUG:
-            print(f'post cov = {np.cov(fold.X.values, rowvar=False)}')  # DEBUG:
+            scale = np.sqrt(eigenvalues)
+            for frame in (fold.data, fold.test_data):
+                frame.df.iloc[:, :M] = frame.df.to_numpy()[:, :M] / scale
             #end of
             folder = repo.fold_folder(0)
             folder.rename(folder.parent / 'PCA')
@@ -352,25 +479,29 @@ class Fold(Repository):
 
     @property
     def normalization(self) -> Normalization:
+        """ The Normalization of this Fold, read on first access if necessary."""
+        self._normalization = Normalization(self) if self._normalization is None else self._normalization
         return self._normalization
 
     @property
     def test_csv(self) -> Path:
-        return self._test_csv
+        return self.folder / f'test.{self.format}'
 
     @property
     def test_data(self) -> Frame:
+        """ The test data, read on first access if necessary."""
+        self._test_data = Frame(self.test_csv) if self._test_data is None else self._test_data
         return self._test_data
 
     @property
     def test_x(self) -> pd.DataFrame:
         """ The test_data input x, as an (n,M) design Matrix with column headings."""
-        return self._test_data.df[self._meta['data']['X_heading']]
+        return self._under_heading(self.test_data.df, self._meta['data']['X_heading'])
 
     @property
     def test_y(self) -> pd.DataFrame:
         """ The test_data output y as an (n,L) Matrix with column headings."""
-        return self._test_data.df[self._meta['data']['Y_heading']]
+        return self._under_heading(self.test_data.df, self._meta['data']['Y_heading'])
 
     def _X_rotate(self, frame: Frame, rotation: NP.Matrix):
         """ Rotate the input variables in a Frame.
@@ -379,21 +510,24 @@ class Fold(Repository):
             frame: The frame to rotate. Will be written after rotation.
             rotation: The rotation Matrix.
         """
-        frame.df.iloc[:, :self.M] = np.einsum('Nm,Mm->NM', frame.df.iloc[:, :self.M], rotation)
+        frame.df.iloc[:, :self.M] = frame.df.to_numpy()[:, :self.M] @ np.transpose(rotation)
         frame.write()
 
     @property
     def X_rotation(self) -> NP.Matrix:
         """ The rotation matrix applied to the input variables self.X, stored in X_rotation.csv. Rotations are applied and stored cumulatively."""
-        return Frame(self._X_rotation, header=[0]).df.values if self._X_rotation.exists() else np.eye(self.M)
+        if self._X_rotation_cache is None:
+            self._X_rotation_cache = Frame(self._X_rotation, header=[0]).df.values if self._X_rotation.exists() else np.eye(self.M)
+        return self._X_rotation_cache
 
     @X_rotation.setter
     def X_rotation(self, value: NP.Matrix):
         """ The rotation matrix applied to the input variables self.X, stored in X_rotation.csv. Rotations are applied and stored cumulatively."""
-        self._X_rotate(self._data, value)
-        self._X_rotate(self._test_data, value)
-        old_value = self.X_rotation
-        Frame(self._X_rotation, pd.DataFrame(np.matmul(old_value, value)))
+        self._X_rotate(self.data, value)
+        self._X_rotate(self.test_data, value)
+        new_value = self.X_rotation @ value
+        Frame(self._X_rotation, pd.DataFrame(new_value))
+        self._X_rotation_cache = new_value
 
     def __init__(self, parent: Repository, k: int, **kwargs):
         """ Initialize Fold by reading existing files. Creation is handled by the classmethod Fold.from_dfs.
@@ -406,10 +540,9 @@ class Fold(Repository):
         init_mode = kwargs.get('init_mode', Repository._InitMode.READ)
         super().__init__(parent.fold_folder(k), init_mode=init_mode)
         self._X_rotation = self.folder / 'X_rotation.csv'
-        self._test_csv = self.folder / 'test.csv'
-        if init_mode == Repository._InitMode.READ:
-            self._test_data = Frame(self._test_csv)
-            self._normalization = Normalization(self)
+        self._X_rotation_cache = None
+        self._test_data = None
+        self._normalization = None
 
     @classmethod
     def from_dfs(cls, parent: Repository, k: int, data: pd.DataFrame, test_data: pd.DataFrame,
@@ -420,7 +553,7 @@ class Fold(Repository):
             parent: The parent Repository.
             k: The index of the fold to be created.
             data: Training data.
-            test_data: Test data.
+            test_data: Test data. If this is (the same object as) data, test.csv is simply copied from data.csv.
             normalization: An optional normalization.csv file to use.
             is_normalization_applicable: Whether normalization is applicable. ``False`` means that normalization whatsoever will be applied.
         Returns: The Fold created.
@@ -428,15 +561,42 @@ class Fold(Repository):
 
         fold = cls(parent, k, init_mode=Repository._InitMode.CREATE)
         fold._meta = cls.META | parent.meta | {'k': k}
-        fold._normalization = Normalization(fold, data, is_normalization_applicable)
-        if normalization is not None:
+        fold._normalization = Normalization(fold, data if normalization is None else None, is_normalization_applicable)
+        if normalization is not None:       # fold._normalization reads this on first use, rather than recalculating it from data.
             shutil.copy(Path(normalization), fold._normalization.csv)
         fold._data = Frame(fold._csv, fold.normalization.apply_to(data))
-        fold._test_data = Frame(fold._test_csv, fold.normalization.apply_to(test_data))
+        if test_data is data:   # Copy the file just written instead of normalizing and writing it again. It is read back on first use.
+            shutil.copyfile(fold._csv, fold.test_csv)
+        else:
+            fold._test_data = Frame(fold.test_csv, fold.normalization.apply_to(test_data))
         fold._update_meta()
+        fold._X_rotation_cache = np.eye(fold.M)
         return fold
 
 
+if njit is not None:
+    @njit(nogil=True, cache=True, error_model='numpy')   # NumPy semantics: a zero range divides to nan or inf, rather than raising.
+    def _uniform(X: NP.Matrix, X_min: NP.Vector, X_rng: NP.Vector, lower: float, upper: float, out: NP.Matrix):
+        """ Fused, GIL-free ``out = clip((X - X_min) / X_rng, lower, upper)``, bitwise identical to the unfused NumPy."""
+        for i in range(X.shape[0]):
+            for j in range(X.shape[1]):
+                out[i, j] = min(max((X[i, j] - X_min[j]) / X_rng[j], lower), upper)
+
+    @njit(nogil=True, cache=True, error_model='numpy')
+    def _standardize(Y: NP.Matrix, Y_mean: NP.Vector, Y_std: NP.Vector, out: NP.Matrix):
+        """ Fused, GIL-free ``out = (Y - Y_mean) / Y_std``, bitwise identical to the unfused NumPy."""
+        for i in range(Y.shape[0]):
+            for j in range(Y.shape[1]):
+                out[i, j] = (Y[i, j] - Y_mean[j]) / Y_std[j]
+
+    @njit(nogil=True, cache=True, error_model='numpy')
+    def _unstandardize(Z: NP.Matrix, scale: NP.Vector, shift: NP.Vector, out: NP.Matrix):
+        """ Fused, GIL-free ``out = Z * scale + shift``, bitwise identical to the unfused NumPy. ``out`` may be ``Z``."""
+        for i in range(Z.shape[0]):
+            for j in range(Z.shape[1]):
+                out[i, j] = Z[i, j] * scale[j] + shift[j]
+
+
 class Normalization:
     """ Encapsulates the normalization of data.
         X data is assumed to follow a Uniform distribution, which is normalized to U[0,1] , then inverse probability transformed to N[0,1].
@@ -448,6 +608,12 @@ class Normalization:
     def UNIFORM_MARGIN(cls) -> float:
         return 1.0E-12
 
+    @classmethod
+    @property
+    def UNIFORM_UPPER(cls) -> float:
+        """ The upper clip of uniformly normalized X, ``1 - UNIFORM_MARGIN``."""
+        return 1.0 - cls.UNIFORM_MARGIN
+
     @property
     def csv(self) -> Path:
         return self._fold.folder / 'normalization.csv'
@@ -458,9 +624,13 @@ class Normalization:
         return self._frame
 
     @property
-    def _relevant_stats(self) -> Tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
-        return (self.frame.df.iloc[self.frame.df.index.get_loc('min'), :self._fold.M], self.frame.df.iloc[self.frame.df.index.get_loc('rng'), :self._fold.M],
-                self.frame.df.iloc[self.frame.df.index.get_loc('mean'), self._fold.M:], self.frame.df.iloc[self.frame.df.index.get_loc('std'), self._fold.M:])
+    def _relevant_stats(self) -> Tuple[NP.Vector, NP.Vector, NP.Vector, NP.Vector]:
+        """ The ``(X_min, X_rng, Y_mean, Y_std)`` used to (un)normalize, read from ``self.frame`` on first access."""
+        if self._stats is None:
+            stats = self.frame.df.loc[['min', 'rng', 'mean', 'std']].to_numpy(dtype=np.float64)
+            M = self._fold.M
+            self._stats = tuple(np.ascontiguousarray(stat) for stat in (stats[0, :M], stats[1, :M], stats[2, M:], stats[3, M:]))
+        return self._stats
 
     @property
     def is_applicable(self) -> bool:
@@ -475,12 +645,21 @@ class Normalization:
         """
         if self._is_applicable:
             X_min, X_rng, Y_mean, Y_std = self._relevant_stats
-            X = df.iloc[:, :self._fold.M].copy(deep=True)
-            Y = df.iloc[:, self._fold.M:].copy(deep=True)
-            X = X.sub(X_min, axis=1)[X_min.axes[0]].div(X_rng, axis=1)[X_rng.axes[0]].clip(lower=self.UNIFORM_MARGIN, upper=1 - self.UNIFORM_MARGIN)
-            X.iloc[:, :] = scipy.stats.norm.ppf(X, loc=0, scale=1)
-            Y = Y.sub(Y_mean, axis=1).div(Y_std, axis=1)
-            return pd.concat((X, Y), axis=1)
+            values, result = df.to_numpy(), np.empty(df.shape, dtype=np.float64)
+            X, Y = result[:, :self._fold.M], result[:, self._fold.M:]
+            if njit is None:
+                np.subtract(values[:, :self._fold.M], X_min, out=X)
+                np.divide(X, X_rng, out=X)
+                np.clip(X, self.UNIFORM_MARGIN, self.UNIFORM_UPPER, out=X)
+            else:
+                _uniform(values[:, :self._fold.M], X_min, X_rng, self.UNIFORM_MARGIN, self.UNIFORM_UPPER, X)
+            scipy.special.ndtri(X, out=X)
+            if njit is None:
+                np.subtract(values[:, self._fold.M:], Y_mean, out=Y)
+                np.divide(Y, Y_std, out=Y)
+            else:
+                _standardize(values[:, self._fold.M:], Y_mean, Y_std, Y)
+            return pd.DataFrame(result, index=df.index, columns=df.columns, copy=False)
         else:
             return df
 
@@ -493,12 +672,18 @@ class Normalization:
         """
         if self._is_applicable:
             X_min, X_rng, Y_mean, Y_std = self._relevant_stats
-            X = df.iloc[:, :self._fold.M].copy(deep=True)
-            Y = df.iloc[:, self._fold.M:].copy(deep=True)
-            X.iloc[:, :] = scipy.stats.norm.cdf(X, loc=0, scale=1)
-            X = X.mul(X_rng, axis=1)[X_rng.axes[0]].add(X_min, axis=1)[X_min.axes[0]]
-            Y = Y.mul(Y_std, axis=1)[Y_std.axes[0]].add(Y_mean, axis=1)[Y_mean.axes[0]]
-            return pd.concat((X, Y), axis=1)
+            values, result = df.to_numpy(), np.empty(df.shape, dtype=np.float64)
+            X, Y = result[:, :self._fold.M], result[:, self._fold.M:]
+            scipy.special.ndtr(values[:, :self._fold.M], out=X)
+            if njit is None:
+                np.multiply(X, X_rng, out=X)
+                np.add(X, X_min, out=X)
+                np.multiply(values[:, self._fold.M:], Y_std, out=Y)
+                np.add(Y, Y_mean, out=Y)
+            else:
+                _unstandardize(X, X_rng, X_min, X)
+                _unstandardize(values[:, self._fold.M:], Y_std, Y_mean, Y)
+            return pd.DataFrame(result, index=df.index, columns=df.columns, copy=False)
         else:
             return df
 
@@ -510,7 +695,7 @@ class Normalization:
         Returns: dfY, UnNormalized.
         """
         X_min, X_rng, Y_mean, Y_std = self._relevant_stats
-        return dfY.copy(deep=True).mul(Y_std, axis=1)[Y_std.axes[0]] if self._is_applicable else dfY
+        return pd.DataFrame(dfY.to_numpy() * Y_std, index=dfY.index, columns=dfY.columns) if self._is_applicable else dfY
 
     def X_gradient(self, X: NP.Matrix, m: int | List[int]):
         """ Computes the gradient of the unormalized inputs ``X[m]`` with respect to the normalized inputs ``Z[m]``.
@@ -520,8 +705,8 @@ class Normalization:
             m: A list of input axes to differentiate.
         Returns: An (N,len(m)) matrix of derivatives
         """
-        X_rng = self._relevant_stats[1].values[m]
-        return X_rng * scipy.stats.norm.pdf(X[..., m], loc=0, scale=1) if self._is_applicable else m / m
+        X_rng = self._relevant_stats[1][m]
+        return np.exp(-0.5 * np.square(X[..., m])) * (X_rng / np.sqrt(2 * np.pi)) if self._is_applicable else m / m
 
     def __repr__(self) -> str:
         return str(self.csv)
@@ -539,20 +724,15 @@ class Normalization:
         """
         self._fold = fold
         self._is_applicable = is_applicable
+        self._stats = None
         if self.csv.exists():
             self._frame = Frame(self.csv)
         elif data is None:
             self._frame = None
         else:
-            mean = data.mean()
-            mean.name = 'mean'
-            std = data.std()
-            std.name = 'std'
+            mean = data.mean().to_numpy()
+            std = data.std().to_numpy()
             semi_range = std * np.sqrt(3)
-            semi_range.name = 'rng'
-            m_min = mean - semi_range
-            m_min.name = 'min'
-            m_max = mean + semi_range
-            m_max.name = 'max'
-            df = pd.concat((mean, std, 2 * semi_range, m_min, m_max), axis=1)
-            self._frame = Frame(self.csv, df.T)
+            df = pd.DataFrame(np.stack((mean, std, 2 * semi_range, mean - semi_range, mean + semi_range)),
+                              index=['mean', 'std', 'rng', 'min', 'max'], columns=data.columns)
+            self._frame = Frame(self.csv, df)
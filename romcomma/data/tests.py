@@ -0,0 +1,72 @@
+#  BSD 3-Clause License.
+# 
+#  Copyright (c) 2019-2024 Robert A. Milton. All rights reserved.
+# 
+#  Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+# 
+#  1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# 
+#  2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the
+#     documentation and/or other materials provided with the distribution.
+# 
+#  3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this
+#     software without specific prior written permission.
+# 
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+#  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Contains tests of the data package."""
+
+from __future__ import annotations
+
+from romcomma.base.definitions import *
+from romcomma.data.storage import Frame
+
+
+def _columns(*names: str) -> pd.MultiIndex:
+    return pd.MultiIndex.from_tuples([(name[0], name) for name in names])
+
+
+def test_header_only_frame(tmp_path: Path):
+    """ A Frame written with no rows must read back as an empty pd.DataFrame with the same columns."""
+    csv = tmp_path / 'empty.csv'
+    pd.DataFrame(np.zeros((0, 3)), columns=_columns('X.0', 'X.1', 'Y.0')).to_csv(csv, **Frame.TO_CSV_OPTIONS)
+    df = Frame(csv).df
+    assert df.shape == (0, 3)
+    assert df.equals(pd.read_csv(csv, **Frame.CSV_OPTIONS))
+
+
+def test_empty_strings_read_as_nan(tmp_path: Path):
+    """ Empty cells in string columns must read back as NaN, as pandas reads them."""
+    csv = tmp_path / 'strings.csv'
+    pd.DataFrame({('X', 'X.0'): [1.0, 2.0], ('S', 'S.0'): ['a', None]}).to_csv(csv, **Frame.TO_CSV_OPTIONS)
+    assert Frame(csv).df.equals(pd.read_csv(csv, **Frame.CSV_OPTIONS))
+
+
+def _write_parity(tmp_path: Path, dtype: type):
+    """ Assert that Frame writes df of dtype byte-for-byte as pandas does."""
+    df = pd.DataFrame(np.random.default_rng(0).random((5, 3)).astype(dtype), columns=_columns('X.0', 'X.1', 'Y.0'))
+    Frame(tmp_path / 'frame.csv', df)
+    df.to_csv(tmp_path / 'pandas.csv', sep=Frame.CSV_OPTIONS['sep'], index=True, **Frame.TO_CSV_OPTIONS)
+    assert (tmp_path / 'frame.csv').read_bytes() == (tmp_path / 'pandas.csv').read_bytes()
+
+
+def test_float64_write_parity(tmp_path: Path):
+    _write_parity(tmp_path, np.float64)
+
+
+def test_float32_write_parity(tmp_path: Path):
+    _write_parity(tmp_path, np.float32)
+
+
+if __name__ == '__main__':
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        test_header_only_frame(Path(folder))
+        test_empty_strings_read_as_nan(Path(folder))
+        test_float64_write_parity(Path(folder))
+        test_float32_write_parity(Path(folder))
@@ -60,11 +60,11 @@ class Kernel(Model):
         """ Merely sets which data are trainable. """
         meta = self.META | kwargs
         if self.is_covariant:
-            gf.set_trainable(self._implementation[0].variance._cholesky_diagonal, meta['variance'])
-            gf.set_trainable(self._implementation[0].variance._cholesky_lower_triangle, meta['covariance'])
-            gf.set_trainable(self._implementation[0].lengthscales, meta['lengthscales']['covariant'])
+            gf.set_trainable(self.implementation[0].variance._cholesky_diagonal, meta['variance'])
+            gf.set_trainable(self.implementation[0].variance._cholesky_lower_triangle, meta['covariance'])
+            gf.set_trainable(self.implementation[0].lengthscales, meta['lengthscales']['covariant'])
         else:
-            for implementation in self._implementation:
+            for implementation in self.implementation:
                 gf.set_trainable(implementation.variance, meta['variance'])
                 gf.set_trainable(implementation.lengthscales, meta['lengthscales']['variant'])
         return meta
@@ -121,6 +121,7 @@ class Kernel(Model):
     def broadcast_parameters(self, variance_shape: Tuple[int, int], M) -> Kernel:
         """ Broadcast this kernel to higher dimensions. Shrinkage raises errors, unchanged dimensions silently nop.
         A diagonal variance matrix broadcast to a square matrix is initially diagonal. All other expansions are straightforward broadcasts.
+        A changed implementation is not rebuilt here, but lazily on first use.
         Args:
             variance_shape: The new shape for the variance, must be (1, L) or (L, L).
             M: The number of input Lengthscales per output.
@@ -128,6 +129,8 @@ class Kernel(Model):
         Raises:
             IndexError: If an attempt is made to shrink a parameter.
         """
+        if (variance_shape, (self._L, M)) == (self._data.frames.variance.df.shape, self._data.frames.lengthscales.df.shape):
+            return self
         if variance_shape != self._data.frames.variance.df.shape:
             self._data.frames.variance.broadcast_value(target_shape=variance_shape, is_diagonal=True)
             self._L = variance_shape[1]
@@ -135,7 +138,6 @@ class Kernel(Model):
             self._data.frames.lengthscales.broadcast_value(target_shape=(self._L, M), is_diagonal=False)
             self._M = M
         self._implementation = None
-        self._implementation = self.implementation
         return self
 
     @property
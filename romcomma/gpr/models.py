@@ -72,8 +72,8 @@ class Likelihood(Model):
         """ Merely sets the trainable data."""
         meta = self.META | kwargs
         if self.is_covariant:
-            gf.set_trainable(self._parent._implementation[0].likelihood.variance._cholesky_diagonal, meta['variance'])
-            gf.set_trainable(self._parent._implementation[0].likelihood.variance._cholesky_lower_triangle, meta['covariance'])
+            gf.set_trainable(self._parent.implementation[0].likelihood.variance._cholesky_diagonal, meta['variance'])
+            gf.set_trainable(self._parent.implementation[0].likelihood.variance._cholesky_lower_triangle, meta['covariance'])
         else:
             for implementation in self._parent.implementation:
                 gf.set_trainable(implementation.likelihood.variance, meta['variance'])
@@ -118,6 +118,12 @@ class GPR(Model):
         """ The name of the folder where kernel data are stored."""
         return "kernel"
 
+    @classmethod
+    @property
+    def TEST_CHUNK(cls) -> int:
+        """ The maximum number of test samples predicted at once by ``test``, bounding its peak memory."""
+        return 4096
+
     @property
     def fold(self) -> Fold:
         """ The parent fold. """
@@ -159,10 +165,9 @@ class GPR(Model):
 
     @property
     def N(self) -> int:
-        """ The the number of training samples."""
+        """ The number of training samples."""
         return self._N
 
-
     @property
     @abstractmethod
     def X(self) -> Any:
@@ -190,12 +195,14 @@ class GPR(Model):
         raise NotImplementedError
 
     @abstractmethod
-    def predict(self, x: NP.Matrix, y_instead_of_f: bool = True) -> Tuple[NP.Matrix, NP.Matrix]:
+    def predict(self, x: NP.Matrix | TF.Matrix, y_instead_of_f: bool = True, is_float32: bool = False) -> Tuple[NP.Matrix, NP.Matrix] | Tuple[TF.Matrix, TF.Matrix]:
         """ Predicts the response to input X.
 
         Args:
-            x: An (o, M) design Matrix of inputs.
+            x: An (o, M) design Matrix of inputs. If this is a tf.Tensor (or tf.Variable) the result is a pair of tf.Tensors, differentiable wrt x.
             y_instead_of_f: True to include noise in the variance of the result.
+            is_float32: True to solve against a float32 copy of the (float64) posterior, halving the memory traffic of prediction
+                at the cost of precision. Ignored when the outputs are covariant.
         Returns: The distribution of y or f, as a pair (mean (o, L) Matrix, std (o, L) Matrix).
         """
 
@@ -240,23 +247,22 @@ class GPR(Model):
         """
         result = Frame(self.test_csv, self._fold.test_data.df)
         Y_heading = self._fold.meta['data']['Y_heading']
-        prediction = self.predict(self._fold.test_x.values)
-        predictive_mean = result.df.loc[:, [Y_heading]].copy().rename(columns={Y_heading: 'Mean'}, level=0)
-        predictive_mean.iloc[:] = prediction[0]
-        predictive_std = result.df.loc[:, [Y_heading]].copy().rename(columns={Y_heading: 'SD'}, level=0)
-        predictive_std.iloc[:] = prediction[1]
-        predictive_score = result.df.loc[:, [Y_heading]].copy().rename(columns={Y_heading: 'Z Score'}, level=0)
-        predictive_score.iloc[:] -= predictive_mean.to_numpy(dtype=float, copy=False)
-        abs_err = result.df.loc[:, [Y_heading]].copy().rename(columns={Y_heading: 'Abs Error'}, level=0)
-        abs_err.iloc[:] -= predictive_mean.to_numpy(dtype=float, copy=False)
-        abs_err = abs(abs_err)
-        rmse = abs_err.iloc[:].copy().rename(columns={'Abs Error': 'RMSE'}, level=0)
-        predictive_score.iloc[:] /= predictive_std.to_numpy(dtype=float, copy=False)
-        outliers = result.df.loc[:, [Y_heading]].copy().rename(columns={Y_heading: 'Outlier'}, level=0)
-        outliers.iloc[:] = predictive_score.to_numpy(dtype=float, copy=False)**2 > 4.0
-        outliers = outliers.join(pd.DataFrame(np.column_stack((np.logical_or.reduce(outliers.to_numpy(dtype=float, copy=False), axis=1),
-                                                              np.logical_and.reduce(outliers.to_numpy(dtype=float, copy=False), axis=1))),
-                                              index=outliers.index, columns=pd.MultiIndex.from_tuples([('Outlier', 'Any Output'), ('Outlier', 'All Outputs')])))
+        Y = result.df[Y_heading]
+        X, Y, outputs = self._fold.test_x.to_numpy(dtype=FLOAT()), Y.to_numpy(dtype=float), Y.columns
+        mean, std = np.empty_like(Y), np.empty_like(Y)
+        for start in range(0, X.shape[0], self.TEST_CHUNK):
+            end = min(X.shape[0], start + self.TEST_CHUNK)
+            mean[start:end], std[start:end] = self.predict(X[start:end])
+        error = Y - mean
+        score = error / std
+        frame = lambda values, name: pd.DataFrame(values, index=result.df.index, columns=pd.MultiIndex.from_product([[name], outputs]), copy=False)
+        predictive_mean, predictive_std, abs_err, predictive_score = (frame(mean, 'Mean'), frame(std, 'SD'), frame(np.abs(error), 'Abs Error'),
+                                                                      frame(score, 'Z Score'))
+        rmse = frame(abs_err.to_numpy(), 'RMSE')
+        outliers = score**2 > 4.0
+        outliers = pd.DataFrame(np.column_stack((outliers, np.logical_or.reduce(outliers, axis=1), np.logical_and.reduce(outliers, axis=1))),
+                                index=result.df.index, columns=pd.MultiIndex.from_tuples([('Outlier', output) for output in outputs]
+                                                                                         + [('Outlier', 'Any Output'), ('Outlier', 'All Outputs')]))
         result.df = result.df.join([predictive_mean, predictive_std, abs_err, predictive_score, outliers])
         result.write()
         rmse = rmse**2
@@ -274,17 +280,22 @@ class GPR(Model):
     def broadcast_parameters(self, is_covariant: bool, is_isotropic: bool) -> GPR:
         """ Broadcast the data of the MOGP (including kernels) to higher dimensions.
         Shrinkage raises errors, unchanged dimensions silently do nothing.
+        A changed implementation is not rebuilt here, but lazily on first use. If nothing changes, the implementation and its caches are kept.
 
         Args:
             is_covariant: Whether the outputs will be treated as dependent.
             is_isotropic: Whether to restrict the kernel to be isotropic.
         Returns: ``self``, for chaining calls.
         """
-        target_shape = (self._L, self._L) if is_covariant else (1, self._L)
-        self._likelihood.data.frames.variance.broadcast_value(target_shape=target_shape, is_diagonal=True)
-        self._kernel.broadcast_parameters(variance_shape=target_shape, M=1 if is_isotropic else self._M)
-        self._implementation = None
-        self._implementation = self.implementation
+        target_shape, M = ((self._L, self._L) if is_covariant else (1, self._L)), (1 if is_isotropic else self._M)
+        kernel = self._kernel.data.frames
+        if (target_shape, target_shape, (self._L, M)) != (self._likelihood.data.frames.variance.df.shape, kernel.variance.df.shape,
+                                                         kernel.lengthscales.df.shape):
+            self._likelihood.data.frames.variance.broadcast_value(target_shape=target_shape, is_diagonal=True)
+            self._kernel.broadcast_parameters(variance_shape=target_shape, M=M)
+            self._implementation = None
+        if self._implementation is None:
+            self._K_cho = self._K_inv_Y = self._posterior32 = self._predict_parameters = None
         return self
 
     def __init__(self, name: str, fold: Fold, is_read: bool | None, is_covariant: bool, is_isotropic: bool,
@@ -320,6 +331,80 @@ class GPR(Model):
         self.broadcast_parameters(is_covariant, is_isotropic)
 
 
+def _training_loss(gp: Any) -> Callable[[], TF.Tensor]:
+    """ The training loss of a GPFlow model, evaluated by ``_rbf_training_loss`` whenever gp is a plain RBF ``gf.models.GPR``.
+    Otherwise ``gp.training_loss``, whose trace is private to gp, is returned.
+
+    Args:
+        gp: An element of ``MOGP.implementation``.
+    Returns: A closure to minimize.
+    """
+    if (isinstance(gp, gf.models.GPR) and isinstance(gp.kernel, gf.kernels.SquaredExponential) and isinstance(gp.mean_function, gf.mean_functions.Zero)
+            and gp.kernel.active_dims == slice(None) and all(parameter.prior is None for parameter in gp.parameters)):
+        X, Y = gp.data
+        return lambda: _rbf_training_loss(X, Y, gp.kernel.variance, gp.kernel.lengthscales, gp.likelihood.variance)
+    return gp.training_loss
+
+
+@tf.function(reduce_retracing=True)
+def _rbf_training_loss(X: TF.Matrix, Y: TF.Matrix, variance: TF.Tensor, lengthscales: TF.Tensor, noise_variance: TF.Tensor) -> TF.Tensor:
+    """ The training loss of a zero mean ``gf.models.GPR`` with an RBF kernel, from its parameters, so that the trace is shared by every MOGP.
+
+    Args:
+        X: An (N,M) design matrix of training inputs.
+        Y: An (N,1) matrix of training outputs.
+        variance: The kernel variance.
+        lengthscales: The kernel lengthscales, a scalar or an (M,) vector.
+        noise_variance: The likelihood variance.
+    Returns: The negative log marginal likelihood.
+    """
+    K = variance * tf.exp(-0.5 * gf.utilities.ops.square_distance(X / lengthscales, None))
+    K_cho = tf.linalg.cholesky(tf.linalg.set_diag(K, tf.linalg.diag_part(K) + noise_variance))
+    return - tf.reduce_sum(gf.logdensities.multivariate_normal(Y, tf.zeros_like(Y), K_cho))
+
+
+@tf.function(jit_compile=True, reduce_retracing=True)
+def _rbf_kernels(X_train: TF.Matrix, X: TF.Matrix, variance: TF.Tensor, lengthscales: TF.Tensor) -> Tuple[TF.Tensor, TF.Tensor]:
+    """ Evaluates L independent RBF kernels as ``gf.kernels.RBF`` does, but from their parameters, so that the compiled graph is shared by every MOGP.
+
+    Args:
+        X_train: An (N,M) design matrix of training inputs.
+        X: An (o,M) design matrix of new inputs.
+        variance: An (L,) tensor of kernel variances.
+        lengthscales: An (L,M) tensor of kernel lengthscales.
+    Returns: The (L,N,o) kernels between X_train and X, and the (L,o) kernel diagonals at X.
+    """
+    X_train = X_train / lengthscales[:, tf.newaxis, :]
+    X = X / lengthscales[:, tf.newaxis, :]
+    r2 = -2 * tf.einsum('lNm, lom -> lNo', X_train, X)
+    r2 += tf.reduce_sum(X_train * X_train, axis=-1)[..., tf.newaxis] + tf.reduce_sum(X * X, axis=-1)[:, tf.newaxis, :]
+    return variance[:, tf.newaxis, tf.newaxis] * tf.exp(-0.5 * r2), tf.broadcast_to(variance[:, tf.newaxis], tf.shape(X)[:-1])
+
+
+@tf.function(jit_compile=True, reduce_retracing=True)
+def _independent_predict(KXx: TF.Tensor, Kxx: TF.Tensor, noise_variance: TF.Tensor, K_cho: TF.Tensor, K_inv_Y: TF.Tensor,
+                         y_instead_of_f: TF.Tensor) -> Tuple[TF.Matrix, TF.Matrix]:
+    """ Predicts the response at o inputs from the posterior ``(K_cho, K_inv_Y)`` of L independent outputs.
+    This holds no model state, so XLA compiles it once per shape and dtype, shared by every MOGP (every fold) rather than once per MOGP.
+    Everything runs in the dtype of the posterior.
+
+    Args:
+        KXx: An (L,N,o) tensor of kernels between training and new inputs.
+        Kxx: An (L,o) tensor of kernel diagonals at the new inputs.
+        noise_variance: An (L,1) tensor of likelihood variances.
+        K_cho: The posterior ``MOGP.K_cho``.
+        K_inv_Y: The posterior ``MOGP.K_inv_Y``.
+        y_instead_of_f: True to include noise in the variance of the result.
+    Returns: The distribution of y or f, as a pair (mean (o, L) Matrix, variance (o, L) Matrix) in FLOAT().
+    """
+    dtype = K_cho.dtype
+    KXx, Kxx, noise_variance = tuple(tf.cast(tensor, dtype) for tensor in (KXx, Kxx, noise_variance))
+    A = tf.linalg.triangular_solve(K_cho, KXx, lower=True)
+    variance = Kxx - tf.reduce_sum(A * A, axis=1)
+    variance = tf.where(y_instead_of_f, variance + noise_variance, variance)
+    return tf.cast(tf.einsum('lNo, lN -> ol', KXx, K_inv_Y[:, 0]), FLOAT()), tf.cast(tf.transpose(variance), FLOAT())
+
+
 # noinspection PyPep8Naming
 class MOGP(GPR):
     """ Implementation of a Gaussian Process."""
@@ -337,7 +422,8 @@ class MOGP(GPR):
                                                              noise_variance=self._likelihood._data.frames.variance.np)
                                              for kernel in self._kernel.implementation)
             else:
-                self._implementation = tuple(gf.models.GPR(data=(self._X, self._Y[:, [l]]), kernel=kernel, mean_function=None,
+                X = tf.constant(self._X)    # Shared by all L outputs, rather than converted into L copies.
+                self._implementation = tuple(gf.models.GPR(data=(X, self._Y[:, [l]]), kernel=kernel, mean_function=None,
                                                            noise_variance=max(self._likelihood._data.frames.variance.np[0, l], self._likelihood.VARIANCE_FLOOR))
                                              for l, kernel in enumerate(self._kernel.implementation))
         return self._implementation
@@ -357,42 +443,61 @@ class MOGP(GPR):
         meta.update(kwargs)
         meta.pop('result', None)
         opt = gf.optimizers.Scipy()
-        meta.update({'result': str(tuple(opt.minimize(closure=gp.training_loss, variables=gp.trainable_variables, method=method, options=meta)
-                                                  for gp in self._implementation)), 'kernel': kernel_options, 'likelihood': likelihood_options})
+        meta.update({'result': str(tuple(opt.minimize(closure=_training_loss(gp), variables=gp.trainable_variables, method=method, options=meta)
+                                                  for gp in self.implementation)), 'kernel': kernel_options, 'likelihood': likelihood_options})
         self.write_meta(meta)
+        self._K_cho = self._K_inv_Y = self._posterior32 = self._predict_parameters = None
         if self._likelihood.is_covariant:
-            self._likelihood.parameters = self.likelihood.data.replace(variance=self._implementation[0].likelihood.variance.value.numpy(),
-                                                                              log_marginal=self._implementation[0].log_marginal_likelihood().numpy())
-            self._kernel.parameters = self.kernel.data.replace(variance=self._implementation[0].kernel.variance.value.numpy(),
-                                                                      lengthscales=tf.squeeze(self._implementation[0].kernel.lengthscales))
+            self._likelihood.parameters = self.likelihood.data.replace(variance=self.implementation[0].likelihood.variance.value.numpy(),
+                                                                              log_marginal=self.implementation[0].log_marginal_likelihood().numpy())
+            self._kernel.parameters = self.kernel.data.replace(variance=self.implementation[0].kernel.variance.value.numpy(),
+                                                                      lengthscales=tf.squeeze(self.implementation[0].kernel.lengthscales))
         else:
-            self._likelihood.parameters = self._likelihood.data.replace(variance=tuple(gp.likelihood.variance.numpy() for gp in self._implementation),
-                                                                              log_marginal=tuple(gp.log_marginal_likelihood() for gp in self._implementation))
-            self._kernel.parameters = self._kernel.data.replace(variance=tuple(gp.kernel.variance.numpy() for gp in self._implementation),
-                                                                      lengthscales=tuple(gp.kernel.lengthscales.numpy() for gp in self._implementation))
+            self._likelihood.parameters = self._likelihood.data.replace(variance=tuple(gp.likelihood.variance.numpy() for gp in self.implementation),
+                                                                              log_marginal=tuple(gp.log_marginal_likelihood() for gp in self.implementation))
+            self._kernel.parameters = self._kernel.data.replace(variance=tuple(gp.kernel.variance.numpy() for gp in self.implementation),
+                                                                      lengthscales=tuple(gp.kernel.lengthscales.numpy() for gp in self.implementation))
         return meta
 
-    def predict(self, X: NP.Matrix, y_instead_of_f: bool = True) -> Tuple[NP.Matrix, NP.Matrix]:
-        X = X.astype(dtype=FLOAT())
+    def predict(self, X: NP.Matrix | TF.Matrix, y_instead_of_f: bool = True, is_float32: bool = False) -> Tuple[NP.Matrix, NP.Matrix] | Tuple[TF.Matrix, TF.Matrix]:
+        is_tensor = tf.is_tensor(X)
+        X = tf.cast(X, FLOAT()) if is_tensor else X.astype(dtype=FLOAT(), copy=False)
         if self._likelihood.is_covariant:
             gp = self.implementation[0]
             results = gp.predict_y(X) if y_instead_of_f else gp.predict_f(X)
         else:
-            results = tuple(gp.predict_y(X) if y_instead_of_f else gp.predict_f(X) for gp in self._implementation)
-            results = tuple(np.transpose(result) for result in zip(*results))
-            results = tuple(results[i][0] for i in range(len(results)))
-        return np.atleast_2d(results[0]), np.atleast_2d(np.sqrt(results[1]))
+            if is_float32:
+                if self._posterior32 is None:
+                    self._posterior32 = tf.cast(self.K_cho, tf.float32), tf.cast(self.K_inv_Y, tf.float32)
+                posterior = self._posterior32
+            else:
+                posterior = self.K_cho, self.K_inv_Y
+            if self._predict_parameters is None:    # Reading gpflow Parameters is slow, so they are cached along with the posterior.
+                self._predict_parameters = {'noise_variance': tf.stack([gp.likelihood.variance for gp in self.implementation])[:, tf.newaxis]}
+                if all(isinstance(gp.kernel, gf.kernels.SquaredExponential) for gp in self.implementation):
+                    self._predict_parameters |= {'variance': tf.stack([gp.kernel.variance for gp in self.implementation]),
+                                                 'lengthscales': tf.stack([tf.broadcast_to(gp.kernel.lengthscales, [self._M])
+                                                                           for gp in self.implementation])}
+            if 'variance' in self._predict_parameters:
+                KXx, Kxx = _rbf_kernels(self.X, X, self._predict_parameters['variance'], self._predict_parameters['lengthscales'])
+            else:
+                KXx = tf.stack([gp.kernel(self.X, X) for gp in self.implementation])
+                Kxx = tf.stack([gp.kernel(X, full_cov=False) for gp in self.implementation])
+            results = _independent_predict(KXx, Kxx, self._predict_parameters['noise_variance'], *posterior, tf.constant(y_instead_of_f))
+        if is_tensor:
+            return results[0], tf.sqrt(results[1])
+        return np.atleast_2d(results[0].numpy()), np.atleast_2d(np.sqrt(results[1].numpy()))
 
     def predict_gradient(self, x: NP.Matrix, y_instead_of_f: bool = True) -> Tuple[TF.Tensor, TF.Tensor]:
-        x = tf.Variable(x.astype(dtype=FLOAT()))
+        x = tf.Variable(x.astype(dtype=FLOAT(), copy=False))
         Lambda = tf.broadcast_to(1.0 / tf.constant(self.kernel.data.frames.lengthscales.np, dtype=FLOAT()), [x.shape[0], self.L, self.M])
         with tf.GradientTape() as tape:
             @tf.function
             def _KXx(x: tf.Variable) -> TF.Tensor:
                 if self._likelihood.is_covariant:
-                    return tf.reshape(self._implementation[0].kernel(self.X, x), [self._L, self._N, self._L, x.shape[0]])
+                    return tf.reshape(self.implementation[0].kernel(self.X, x), [self._L, self._N, self._L, x.shape[0]])
                 else:
-                    return tf.stack([gp.kernel(self.X, x) for gp in self._implementation], axis=0)
+                    return tf.stack([gp.kernel(self.X, x) for gp in self.implementation], axis=0)
             KXx = _KXx(x)
         dxKXx = tape.jacobian(KXx, x)
         if self._likelihood.is_covariant:
@@ -402,7 +507,7 @@ class MOGP(GPR):
             var = tf.reshape(tf.linalg.triangular_solve(self.K_cho, dxKXx, lower=True), [self._L, self._N,  self._L, x.shape[0], self._M])
             var = -tf.einsum('LNlOM, LNlom -> OLolMm', var, var)
             ddxxkxx = tf.einsum('OLM, olM, LOlo -> OLolM', Lambda, Lambda,
-                                tf.reshape(self._implementation[0].kernel(x), [self._L, x.shape[0], self._L, x.shape[0]]))
+                                tf.reshape(self.implementation[0].kernel(x), [self._L, x.shape[0], self._L, x.shape[0]]))
         else:
             dxKXx = tf.einsum('LNooM -> LNoM', dxKXx)
             mean = tf.einsum('lNoM, liN -> olM', dxKXx, self.K_inv_Y)
@@ -410,38 +515,64 @@ class MOGP(GPR):
             var = tf.reshape(tf.linalg.triangular_solve(self.K_cho, dxKXx, lower=True), [self._L, self._N, x.shape[0], self._M])
             var = -tf.einsum('LNOM, LNom -> OoLMm', var, var)
             ddxxkxx = tf.einsum('OLM, oLM, LOo -> OoLM', Lambda, Lambda,
-                                tf.stack([gp.kernel(x) for gp in self._implementation], axis=0))
+                                tf.stack([gp.kernel(x) for gp in self.implementation], axis=0))
         var = tf.linalg.set_diag(var, tf.linalg.diag_part(var) + ddxxkxx)
         return mean, var
 
+    def predict_joint(self, x: NP.Matrix) -> Tuple[TF.Tensor, TF.Tensor, TF.Tensor]:
+        """ The Cholesky factor of the joint (training and new input) covariance, as three blocks built from the cached ``self.K_cho``,
+        without factorizing the joint covariance afresh. ``L_22 @ transpose(L_22)`` is the posterior covariance of f at x.
+
+        Args:
+            x: An (o, M) matrix of new inputs.
+        Returns: ``(L_11, L_21, L_22)``, with ``L_11 = self.K_cho``. If the outputs are independent these have shapes (L,N,N), (L,o,N), (L,o,o),
+            otherwise (LN,LN), (Lo,LN), (Lo,Lo).
+        """
+        x = x.astype(dtype=FLOAT(), copy=False)
+        o = x.shape[0]
+        if self._likelihood.is_covariant:
+            kernel = self.implementation[0].kernel
+            KXx = tf.reshape(kernel(self.X, x), [self._L * self._N, self._L * o])
+            Kxx = tf.reshape(kernel(x), [self._L * o, self._L * o])
+        else:
+            KXx = tf.stack([gp.kernel(self.X, x) for gp in self.implementation])
+            Kxx = tf.stack([gp.kernel(x) for gp in self.implementation])
+        L_21 = tf.linalg.matrix_transpose(tf.linalg.triangular_solve(self.K_cho, KXx, lower=True))
+        S = Kxx - tf.matmul(L_21, L_21, transpose_b=True)
+        L_22 = tf.linalg.cholesky(tf.linalg.set_diag(S, tf.linalg.diag_part(S) + gf.config.default_jitter()))
+        return self.K_cho, L_21, L_22
+
     @property
     def X(self) -> TF.Matrix:
         """ The implementation training inputs as an (N,M) design matrix."""
-        return self._implementation[0].data[0]
+        return self.implementation[0].data[0]
 
     @property
     def Y(self) -> TF.Matrix:
         """ The implementation training outputs as an (N,L) design matrix. """
-        return self._implementation[0].data[1] if self._likelihood.is_covariant else tf.concat([gp.data[1] for gp in self._implementation], axis=1)
+        return self.implementation[0].data[1] if self._likelihood.is_covariant else tf.concat([gp.data[1] for gp in self.implementation], axis=1)
 
     @property
     def K_cho(self) -> TF.Tensor:
-        if self._likelihood.is_covariant:
-            gp = self._implementation[0]
-            result = gp.likelihood.add_to(gp.KXX)
-        else:
-            result = []
-            for gp in self._implementation:
-                K = gp.kernel(self.X)
-                K_diag = tf.linalg.diag_part(K)
-                result.append(tf.linalg.set_diag(K, K_diag + tf.fill(tf.shape(K_diag), gp.likelihood.variance)))
-            result = tf.stack(result)
-        return tf.linalg.cholesky(result)
+        """ Cached until the hyper-parameters change, through ``self.calibrate()`` or ``self.broadcast_parameters()``."""
+        if self._K_cho is None:
+            if self._likelihood.is_covariant:
+                gp = self.implementation[0]
+                result = gp.likelihood.add_to(gp.KXX)
+            else:
+                result = tf.stack([gp.kernel(self.X) for gp in self.implementation])    # (L,N,N) blocks, never an (LN,LN) matrix.
+                noise_variance = tf.stack([gp.likelihood.variance for gp in self.implementation])[:, tf.newaxis]
+                result = tf.linalg.set_diag(result, tf.linalg.diag_part(result) + noise_variance)
+            self._K_cho = tf.linalg.cholesky(result)
+        return self._K_cho
 
     @property
     def K_inv_Y(self) -> TF.Tensor:
-        Y = tf.reshape(tf.transpose(self.Y), [-1, 1]) if self._likelihood.is_covariant else tf.transpose(self.Y)[..., tf.newaxis]
-        return tf.reshape(tf.linalg.cholesky_solve(self.K_cho, Y), [self._L, 1, self._N])
+        """ Cached until the hyper-parameters change, through ``self.calibrate()`` or ``self.broadcast_parameters()``."""
+        if self._K_inv_Y is None:
+            Y = tf.reshape(tf.transpose(self.Y), [-1, 1]) if self._likelihood.is_covariant else tf.transpose(self.Y)[..., tf.newaxis]
+            self._K_inv_Y = tf.reshape(tf.linalg.cholesky_solve(self.K_cho, Y), [self._L, 1, self._N])
+        return self._K_inv_Y
 
     def check_K_inv_Y(self, x: NP.Matrix) -> NP.Matrix:
         """ FOR TESTING PURPOSES ONLY. Should return 0 Vector (to within numerical error tolerance).
@@ -453,10 +584,10 @@ class MOGP(GPR):
         predicted = self.predict(x)[0]
         o = predicted.shape[0]
         if self._likelihood.is_covariant:
-            kernel = tf.reshape(self._implementation[0].kernel(x, self.X), [self._L, o, self._L, self._N])
+            kernel = tf.reshape(self.implementation[0].kernel(x, self.X), [self._L, o, self._L, self._N])
             ein = 'loLN, LiN -> ol'
         else:
-            kernel = tf.stack([gp.kernel(x, self.X) for gp in self._implementation], axis=0)
+            kernel = tf.stack([gp.kernel(x, self.X) for gp in self.implementation], axis=0)
             ein = 'loN, liN -> ol'
         result = tf.einsum(ein, kernel, self.K_inv_Y)
         result -= predicted
@@ -60,10 +60,15 @@ class Gaussian:
         """ The sqrt of the determinant of the Gaussian covariance. """
         return tf.reduce_prod(self.cho_diag, axis=-1)
 
+    @property
+    def log_det(self) -> TF.Tensor:
+        """ The log of ``det``, summed in log space so that it cannot underflow or overflow for large M. """
+        return tf.reduce_sum(tf.math.log(self.cho_diag), axis=-1)
+
     @property
     def pdf(self) -> TF.Tensor:
         """ Calculate the Gaussian pdf from the output of Gaussian."""
-        return tf.exp(self.exponent) / self.det
+        return tf.exp(self.exponent - self.log_det)
 
     def expand_dims(self, axes: Sequence[int]) -> Gaussian:
         """ Insert dimensions at the specified axes.
@@ -72,19 +77,31 @@ class Gaussian:
             axes: A sequence of dims to insert.
         Returns: ``self`` for chaining calls.
         """
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
         for axis in sorted(axes, reverse=True):
             result.exponent = tf.expand_dims(result.exponent, axis)
             result.cho_diag = tf.expand_dims(result.cho_diag, (axis - 1) if axis < 0 else axis)
         return result
 
+    def gather(self, indices: TF.Tensor) -> Gaussian:
+        """ Gather along the leading axis.
+
+        Args:
+            indices: The indices to gather.
+        Returns: A new Gaussian.
+        """
+        result = copy.copy(self)
+        result.exponent = tf.gather(result.exponent, indices)
+        result.cho_diag = tf.gather(result.cho_diag, indices)
+        return result
+
     def __truediv__(self, other) -> Gaussian:
         """ Divide this Gaussian pdf by denominator.
 
         Args:
             other: The Gaussian to divide by.
         """
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
         result.exponent -= other.exponent
         result.cho_diag /= other.cho_diag
         return result
@@ -112,13 +129,16 @@ class Gaussian:
             mean = tf.reshape(mean, fill + shape)
         ordinate = ordinate - mean
         # Broadcast variance_cho
-        insertions = (tf.rank(variance_cho) - (1 if is_variance_diagonal else 2))
+        insertions = (variance_cho.shape.rank - (1 if is_variance_diagonal else 2))
         insertions -= insertions % LBunch
-        for axis in range(insertions, 0, -LBunch):
-            variance_cho = tf.expand_dims(variance_cho, axis=axis)
+        if insertions > 0:
+            shape = variance_cho.shape.as_list()
+            for axis in range(insertions, 0, -LBunch):
+                shape.insert(axis, 1)
+            variance_cho = tf.reshape(variance_cho, shape)
         # Calculate the Gaussian pdf.
         if is_variance_diagonal:
-            exponent = ordinate / tf.broadcast_to(variance_cho, tf.concat([variance_cho.shape[:-2], ordinate.shape[-2:]], axis=0))
+            exponent = ordinate / variance_cho
         else:
             exponent = tf.squeeze(tf.linalg.triangular_solve(variance_cho, ordinate[..., tf.newaxis], lower=True), axis=-1)
         exponent = - 0.5 * tf.einsum('...o, ...o -> ...', exponent, exponent)
@@ -127,25 +147,29 @@ class Gaussian:
 
 
 def sym_check(tensor: TF.Tensor, transposition: List[int]) -> TF.Tensor:
-    return tf.reduce_sum((tensor - tf.transpose(tensor, transposition))**2)
+    return tf.reduce_sum(tf.math.squared_difference(tensor, tf.transpose(tensor, transposition)))
+
+
+def _size(tensor: TF.Tensor):
+    """ The number of elements in tensor, as a Python float whenever the shape is static."""
+    n = tensor.shape.num_elements()
+    return tf.cast(tf.size(tensor), FLOAT()) if n is None else float(n)
 
 
 def mean(tensor: TF.Tensor):
-    n = tf.cast(tf.reduce_prod(tensor.shape), FLOAT())
-    return tf.divide(tf.reduce_sum(tensor), n)
+    return tf.divide(tf.reduce_sum(tensor), _size(tensor))
 
 
-def sos(tensor: TF.Tensor, ein: str = 'lijk, lijk'):
-    return tf.einsum(ein, tensor, tensor)
+def sos(tensor: TF.Tensor):
+    return tf.reduce_sum(tf.square(tensor))
 
 
-def ms(tensor: TF.Tensor, ein: str = 'lijk'):
-    n = tf.cast(tf.reduce_prod(tensor.shape), FLOAT())
-    return tf.divide(sos(tensor, ein), n)
+def ms(tensor: TF.Tensor):
+    return tf.divide(sos(tensor), _size(tensor))
 
 
-def rms(tensor: TF.Tensor, ein: str = 'lijk, lijk'):
-    return tf.sqrt(ms(tensor, ein))
+def rms(tensor: TF.Tensor):
+    return tf.sqrt(ms(tensor))
 
 
 I = [0, 0, 0, 0]
@@ -42,9 +42,11 @@ class ClosedSobol(gf.Module, Calibrator):
     def META(cls) -> Dict[str, Any]:
         """ Default calculation meta.
 
-        Returns: An empty dictionary.
+        Returns:
+            is_jit_compiled: If True, marginalize is compiled by XLA, once for each distinct m. Each compilation costs seconds,
+                so this only pays off when L, M and N are large enough for the fused kernels to outweigh it.
         """
-        return {}
+        return {'is_jit_compiled': False}
 
     def marginalize(self, m: TF.Slice) -> Dict[str, TF.Tensor]:
         """ Calculate everything.
@@ -53,31 +55,32 @@ class ClosedSobol(gf.Module, Calibrator):
         Returns: The Sobol ClosedSobol of m.
         """
         G, Phi = self.G[..., m[0]:m[1]], self.Phi[..., m[0]:m[1]]
-        result = {'V': self._V(G, Phi)}
+        result = {'V': self._V(G, Phi, Gaussian(mean=G, variance=Phi, is_variance_diagonal=True, LBunch=2))}
         result['S'] = result['V'] / self.V[2]
         return result
 
-    def _V(self, G: TF.Tensor, Phi: TF.Tensor) -> TF.Tensor:
+    def _V(self, G: TF.Tensor, Phi: TF.Tensor, GGaussian: Gaussian) -> TF.Tensor:
         """ Calculate V.
 
         Args:
             G: marginalized
-            Gamma: marginalized
+            Phi: marginalized
+            GGaussian: ``Gaussian(mean=G, variance=Phi)``, which callers share with any other calculation at this marginalization.
         Returns: V[m], according to marginalization.
 
         """
+        # V is symmetric in L^2, so only the upper triangle of pairs p = (l, j) is calculated.
+        l, j = self.pairs[:, 0], self.pairs[:, 1]
         Gamma = 1 - Phi
-        Psi = tf.expand_dims(tf.expand_dims(Gamma, axis=2), axis=2) + Gamma[tf.newaxis, tf.newaxis, ...]    # Symmetric in L^4
-        Psi = Psi - tf.einsum('lLM, jJM -> lLjJM', Gamma, Gamma)    # Symmetric in L^4
-        PsiPhi = tf.einsum('lLjJM, lLM -> lLjJM', Psi, Phi)    # Symmetric in L^4
-        PhiG = tf.expand_dims(tf.einsum('lLM, jJnM -> lLjJnM', Phi, G), axis=2)    # Symmetric in L^4 N^2
-        # print(sym_check(PhiG, [3, 4, 5, 0, 1, 2, 6])) note the symmetry.
-        PhiGauss = Gaussian(mean=G, variance=Phi, is_variance_diagonal=True, LBunch=2)
-        H = Gaussian(mean=PhiG, variance=PsiPhi, ordinate=G[..., tf.newaxis, tf.newaxis, tf.newaxis, :], is_variance_diagonal=True, LBunch=2)
-        H /= PhiGauss.expand_dims([-1, -2, -3])   # Symmetric in L^4 N^2
-        # print(sym_check(H, [0, 1, 2, 4, 3, 5])) note the symmetry.
-        V = tf.einsum('lLN, lLNjJn, jJn -> lj', self.g0KY, H.pdf, self.g0KY)    # Symmetric in L^2
-        return V
+        Gamma_l, Gamma_j, Phi_l = tf.gather(Gamma, l)[:, :, tf.newaxis, :], tf.gather(Gamma, j)[:, tf.newaxis, ...], tf.gather(Phi, l)
+        Psi = Gamma_l + Gamma_j - Gamma_l * Gamma_j
+        PsiPhi = (Psi * Phi_l[:, :, tf.newaxis, :])[:, :, tf.newaxis, :, tf.newaxis, :]
+        PhiG = Phi_l[:, :, tf.newaxis, tf.newaxis, tf.newaxis, :] * tf.gather(G, j)[:, tf.newaxis, tf.newaxis, ...]
+        H = Gaussian(mean=PhiG, variance=PsiPhi, ordinate=tf.gather(G, l)[:, :, :, tf.newaxis, tf.newaxis, :], is_variance_diagonal=True, LBunch=10000)
+        H /= GGaussian.gather(l).expand_dims([-1, -2])
+        V = tf.einsum('pLN, pLNJn, pJn -> p', tf.gather(self.g0KY, l), H.pdf, tf.gather(self.g0KY, j))
+        V = tf.scatter_nd(self.pairs, V, [self.L, self.L])
+        return tf.linalg.set_diag(V + tf.transpose(V), tf.linalg.diag_part(V))
 
     def _calibrate(self):
         """ Called by constructor to calculate all available quantities prior to marginalization.
@@ -88,12 +91,13 @@ class ClosedSobol(gf.Module, Calibrator):
         self.g0 *= pre_factor[..., tf.newaxis]     # Symmetric in L^2
         self.g0KY = self.g0 * self.K_inv_Y     # NOT symmetric in L^2
         self.g0KY -= tf.einsum('lLN -> l', self.g0KY)[..., tf.newaxis, tf.newaxis]/tf.cast(tf.reduce_prod(self.g0KY.shape[1:]), dtype=FLOAT())
-        self.G = tf.einsum('lLM, NM -> lLNM', self.Lambda2[-1][1], self.gp.X)     # Symmetric in L^2
+        self.G = self.Lambda2[-1][1][:, :, tf.newaxis, :] * self.gp.X[tf.newaxis, tf.newaxis, ...]     # Symmetric in L^2
         self.Phi = self.Lambda2[-1][1]     # Symmetric in L^2
-        self.V = {0: self._V(self.G, self.Phi)}     # Symmetric in L^2
+        self.GGaussian = Gaussian(mean=self.G, variance=self.Phi, is_variance_diagonal=True, LBunch=2)
+        self.V = {0: self._V(self.G, self.Phi, self.GGaussian)}     # Symmetric in L^2
         self.V |= {1: tf.linalg.diag_part(self.V[0])}
         V = tf.sqrt(self.V[1])
-        self.V |= {2: tf.einsum('l, i -> li', V, V)}
+        self.V |= {2: V[:, tf.newaxis] * V[tf.newaxis, :]}
         self.S = self.V[0]/self.V[2]
 
     def _Lambda2(self) -> Dict[int, Tuple[TF.Tensor]]:
@@ -102,9 +106,9 @@ class ClosedSobol(gf.Module, Calibrator):
         Returns: {1: <Lambda^2 + J>, -1: <Lambda^2 + J>^(-1)} for J in {0,1,2}.
         """
         if self.is_F_diagonal:
-            result = tf.einsum('lM, lM -> lM', self.Lambda, self.Lambda)[:, tf.newaxis, :]
+            result = (self.Lambda * self.Lambda)[:, tf.newaxis, :]
         else:
-            result = tf.einsum('lM, LM -> lLM', self.Lambda, self.Lambda)
+            result = self.Lambda[:, tf.newaxis, :] * self.Lambda[tf.newaxis, ...]
         result = tuple(result + j for j in range(3))
         return {1: result, -1: tuple(value**(-1) for value in result)}
 
@@ -136,11 +140,23 @@ class ClosedSobol(gf.Module, Calibrator):
             self.F = tf.reshape(self.F, [self.L, 1])
         else:
             self.K_inv_Y = tf.transpose(self.K_inv_Y, [1, 0, 2])
+        self.pairs = tf.constant(np.stack(np.triu_indices(self.L), axis=-1), dtype=INT())
         # Set Lambdas
         self.Lambda = tf.broadcast_to(tf.constant(self.gp.kernel.data.frames.lengthscales.np, dtype=FLOAT()), [self.L, self.M])
         self.Lambda2 = self._Lambda2()
         # Calculate and store values for m=0 and m=M
         self._calibrate()
+        # Memoize marginalize. Keys are Python ints, which XLA also needs as static slices, so each distinct m is traced once.
+        marginalize = tf.function(self.marginalize, jit_compile=True) if self.meta['is_jit_compiled'] else self.marginalize
+        self._marginals = {}
+
+        def marginalize_once(m: TF.Slice) -> Dict[str, TF.Tensor]:
+            m = tuple(int(i) for i in m)
+            if m not in self._marginals:
+                self._marginals[m] = marginalize(m)
+            return self._marginals[m]
+
+        self.marginalize = marginalize_once
 
 
 class ClosedSobolWithError(ClosedSobol):
@@ -154,7 +170,7 @@ class ClosedSobolWithError(ClosedSobol):
         Returns:
             is_T_partial: If True this effectively asserts the full ['M'] model is variance free, so WmM is not calculated or returned.
         """
-        return {'is_T_partial': True}
+        return ClosedSobol.META | {'is_T_partial': True}
 
     class RankEquation(NamedTuple):
         l: str
@@ -206,8 +222,7 @@ class ClosedSobolWithError(ClosedSobol):
         for rank_eq in rank_eqs:
             eq_ranks_variance = self._equateRanks(tf.expand_dims(variance, N_axis), rank_eq)[..., tf.newaxis, :]
             eq_ranks_mean = self._equateRanks(mean, rank_eq)[..., tf.newaxis, :]
-            shape = tf.concat([eq_ranks_mean.shape[:-2], ordinate.shape[-2:]], axis=0) if tf.rank(ordinate) > 2 else None
-            eq_ranks_mean = (eq_ranks_mean if shape is None else tf.broadcast_to(eq_ranks_mean, shape)) - ordinate
+            eq_ranks_mean = eq_ranks_mean - ordinate
             result += [Gaussian(mean=eq_ranks_mean, variance=eq_ranks_variance, is_variance_diagonal=True, LBunch=10000)]
         return result
 
@@ -222,38 +237,36 @@ class ClosedSobolWithError(ClosedSobol):
             rank_eqs: A tuple of RankEquators to apply.
         Returns: liLNjkJn.
         """
+        if mp is not self.Ms:   # Everything is elementwise in M, so marginalize first and calculate only the mp columns.
+            G, Phi, Upsilon = tuple(tensor[..., mp[0]:mp[1]] for tensor in (G, Phi, Upsilon))
         Gamma = 1 - Phi
         Gamma_inv = 1 / Gamma
-        Pi = 1 + Phi + tf.einsum('ikM, ikM, ikM -> ikM', Phi, Gamma_inv, Phi)
+        Pi = 1 + Phi + Phi * Gamma_inv * Phi
         Pi = 1 / Pi
-        B = tf.einsum('jJM, jJM -> jJM', Gamma, Phi)[tf.newaxis, :, tf.newaxis, ...]
-        B += tf.einsum('jJM, ikM, jJM -> ijkJM', Phi, Pi, Phi)
+        B = (Gamma * Phi)[tf.newaxis, :, tf.newaxis, ...]
+        B += (Phi * Phi)[tf.newaxis, :, tf.newaxis, ...] * Pi[:, tf.newaxis, :, tf.newaxis, :]
         Gamma_reshape = Gamma[:, tf.newaxis, :, tf.newaxis, :]
-        C = Gamma_reshape / (1 - tf.einsum('lLM, ikM -> liLkM', Phi, Upsilon))
-        C = tf.einsum('ikM, liLkM -> liLkM', (1 - Upsilon), C)
-        Omega = tf.einsum('ikM, ikM, ikM -> ikM', Pi, Phi, Gamma_inv)
-        Omega = tf.einsum('jJM, ikM -> ijkJM', Phi, Omega)
-        mean = tf.einsum('ijkJM, liLkM, lLM, lLNM -> liLNjkJM', Omega, C, Gamma_inv, G)
-        variance = B[tf.newaxis, :, tf.newaxis, ...] + tf.einsum('ijkJM, liLkM, ijkJM -> liLjkJM', Omega, C, Omega)
-        if mp is not self.Ms:
-            variance = variance[..., mp[0]:mp[1]]
-            mean = mean[..., mp[0]:mp[1]]
-            G = G[..., mp[0]:mp[1]]
+        C = Gamma_reshape / (1 - Phi[:, tf.newaxis, :, tf.newaxis, :] * Upsilon[tf.newaxis, :, tf.newaxis, ...])
+        C = (1 - Upsilon)[tf.newaxis, :, tf.newaxis, ...] * C
+        Omega = Pi * Phi * Gamma_inv
+        Omega = Phi[tf.newaxis, :, tf.newaxis, ...] * Omega[:, tf.newaxis, :, tf.newaxis, :]
+        mean = (Omega[tf.newaxis, :, tf.newaxis, tf.newaxis, ...] * C[:, :, :, tf.newaxis, tf.newaxis, :, tf.newaxis, :]
+                * (Gamma_inv[..., tf.newaxis, :] * G)[:, tf.newaxis, :, :, tf.newaxis, tf.newaxis, tf.newaxis, :])
+        variance = B[tf.newaxis, :, tf.newaxis, ...] + (Omega * Omega)[tf.newaxis, :, tf.newaxis, ...] * C[:, :, :, tf.newaxis, :, tf.newaxis, :]
         return self._equatedRanksGaussian(mean, variance, G[:, tf.newaxis, ...], rank_eqs)
 
-    def _UpsilonGaussian(self, G: TF.Tensor, Phi: TF.Tensor, Upsilon: TF.Tensor, rank_eqs: Tuple[RankEquation]) -> List[Gaussian]:
+    def _UpsilonGaussian(self, G: TF.Tensor, Phi: TF.Tensor, Upsilon_cho: TF.Tensor, rank_eqs: Tuple[RankEquation]) -> List[Gaussian]:
         """ The Upsilon integral.
 
         Args:
             G: lLNM.
             Phi: lLM.
-            Upsilon: ikM.
+            Upsilon_cho: ikM, the elementwise sqrt of Upsilon.
             rank_eqs: A tuple of RankEquators to apply.
         Returns: liLNjkJn.
         """
-        Upsilon_cho = tf.sqrt(Upsilon)
-        mean = tf.einsum('ikM, lLNM -> liLNkM', Upsilon_cho, G)[..., tf.newaxis, :, tf.newaxis, :]
-        variance = 1 - tf.einsum('ikM, lLM, ikM -> liLkM', Upsilon_cho, Phi, Upsilon_cho)[..., tf.newaxis, :, tf.newaxis, :]
+        mean = (Upsilon_cho[tf.newaxis, :, tf.newaxis, tf.newaxis, ...] * G[:, tf.newaxis, :, :, tf.newaxis, :])[..., tf.newaxis, :, tf.newaxis, :]
+        variance = 1 - ((Upsilon_cho * Upsilon_cho)[tf.newaxis, :, tf.newaxis, ...] * Phi[:, tf.newaxis, :, tf.newaxis, :])[..., tf.newaxis, :, tf.newaxis, :]
         return self._equatedRanksGaussian(mean, variance, tf.constant(0, dtype=FLOAT()), rank_eqs)
 
     def _mu_phi_mu(self, GGaussian: Gaussian, UpsilonGaussians: List[Gaussian], OmegaGaussians: List[Gaussian], rank_eqs: Tuple[RankEquation]) -> TF.Tensor:
@@ -277,14 +290,14 @@ class ClosedSobolWithError(ClosedSobol):
                 OmegaGaussians[i].cho_diag = (diag_det(OmegaGaussians[i].cho_diag) * diag_det(UpsilonGaussians[i].cho_diag))[..., tf.newaxis]
             if rank_eq in self.RANK_EQUATIONS.MIXED:
                 result = tf.einsum('kLN, LNjkJn, jJn -> jk', self.g0KY, OmegaGaussians[i].pdf, self.g0KY)
-                mu_phi_mu += tf.einsum('k, jk -> jk', self.mu_phi_mu['pre-factor'], result)
+                mu_phi_mu += self.mu_phi_mu['pre-factor'][tf.newaxis, :] * result
                 mu_phi_mu = tf.linalg.set_diag(mu_phi_mu, 2 * tf.linalg.diag_part(mu_phi_mu))
             elif rank_eq.l == 'k' and rank_eq.i == 'j':
                 result = tf.einsum('jLN, LNjkJn, jJn -> j', self.g0KY, OmegaGaussians[i].pdf, self.g0KY)
-                mu_phi_mu += tf.linalg.diag(tf.einsum('j, j -> j', self.mu_phi_mu['pre-factor'], result))
+                mu_phi_mu += tf.linalg.diag(self.mu_phi_mu['pre-factor'] * result)
             else:
                 result = tf.einsum(f'jLN, LNjkJn, jJn -> jk', self.g0KY, OmegaGaussians[i].pdf, self.g0KY)
-                mu_phi_mu += tf.einsum(f'k, jk -> jk', self.mu_phi_mu['pre-factor'], result)
+                mu_phi_mu += self.mu_phi_mu['pre-factor'][tf.newaxis, :] * result
         return mu_phi_mu
 
     def _psi_factor(self, G: TF.Tensor, Phi: TF.Tensor, GGaussian: Gaussian) -> TF.Tensor:
@@ -296,17 +309,22 @@ class ClosedSobolWithError(ClosedSobol):
             GGaussian: lLn
         Returns: liS
         """
-        D = Phi[..., tf.newaxis, tf.newaxis, :] - tf.einsum('lLM, iIM, lLM -> lLiIM', Phi, Phi, Phi)
-        mean = tf.einsum('lLM, iInM -> lLiInM', Phi, G)
+        D = Phi[..., tf.newaxis, tf.newaxis, :] - (Phi * Phi)[:, :, tf.newaxis, tf.newaxis, :] * Phi[tf.newaxis, tf.newaxis, ...]
+        mean = Phi[:, :, tf.newaxis, tf.newaxis, tf.newaxis, :] * G[tf.newaxis, tf.newaxis, ...]
         mean = mean[:, :, tf.newaxis, ...] - G[..., tf.newaxis, tf.newaxis, tf.newaxis, :]
         gaussian = Gaussian(mean=mean, variance=D, is_variance_diagonal=True, LBunch=2)
         gaussian /= GGaussian.expand_dims([-1, -2, -3])
         factor = tf.einsum('lLN, iIn, lLNiIn -> liIn', self.g0KY, self.g0, gaussian.pdf)
-        if tf.rank(self.K_cho) == 2 and factor.shape[-2] == 1:
+        if self.K_cho.shape.rank == 2 and factor.shape[-2] == 1:
             factor = tf.einsum('lNiI -> liIN', tf.linalg.diag(tf.einsum('liIN -> lNi', factor)))
-        factor = tf.reshape(factor, factor.shape[:-2].as_list() + [-1, 1])
-        factor = tf.squeeze(tf.linalg.triangular_solve(self.K_cho, factor), axis=-1)
-        return factor
+        factor = tf.reshape(factor, factor.shape[:-2].as_list() + [-1])
+        # Solve for all right-hand sides at once, as the columns of one matrix per K_cho, rather than as a batch of vectors.
+        if self.K_cho.shape.rank == 2:
+            shape = factor.shape.as_list()
+            factor = tf.linalg.triangular_solve(self.K_cho, tf.transpose(tf.reshape(factor, [-1, shape[-1]])))
+            return tf.reshape(tf.transpose(factor), shape)
+        factor = tf.linalg.triangular_solve(self.K_cho, tf.transpose(factor, [1, 2, 0]))
+        return tf.transpose(factor, [2, 0, 1])
 
     def _mu_psi_mu(self, psi_factor: TF.Tensor, rank_eqs: Tuple[RankEquation]) -> TF.Tensor:
         """ Multiply psi_factors to calculate mu_psi_mu.
@@ -351,18 +369,19 @@ class ClosedSobolWithError(ClosedSobol):
             m: A Tf.Tensor pair of ints indicating the slice [m[0]:m[1]].
         Returns: The Sobol ClosedSobol of m, with errors (T and W).
         """
-        result = super().marginalize(m)
-        G, Phi, Upsilon = tuple(tensor[..., m[0]:m[1]] for tensor in (self.G, self.Phi, self.Upsilon))
+        G, Phi, Upsilon_cho = tuple(tensor[..., m[0]:m[1]] for tensor in (self.G, self.Phi, self.Upsilon_cho))
         GGaussian = Gaussian(G, Phi, is_variance_diagonal=True, LBunch=2)
+        result = {'V': self._V(G, Phi, GGaussian)}
+        result['S'] = result['V'] / self.V[2]
         psi_factor = self._psi_factor(G, Phi, GGaussian)
         if self.meta['is_T_partial']:
-            UpsilonGaussians = self._UpsilonGaussian(G, Phi, Upsilon, self.RANK_EQUATIONS.DIAGONAL)
+            UpsilonGaussians = self._UpsilonGaussian(G, Phi, Upsilon_cho, self.RANK_EQUATIONS.DIAGONAL)
             OmegaGaussians = self._OmegaGaussian(m, self.G, self.Phi, self.Upsilon, self.RANK_EQUATIONS.DIAGONAL)
             Wmm = self._W(self._mu_phi_mu(GGaussian, UpsilonGaussians, OmegaGaussians, self.RANK_EQUATIONS.DIAGONAL),
                           self._mu_psi_mu(psi_factor, self.RANK_EQUATIONS.DIAGONAL))
             result |= {'W': Wmm, 'T': self._T(Wmm)}
         else:
-            UpsilonGaussians = self.RankEquations(*(self._UpsilonGaussian(G, Phi, Upsilon, rank_eqs) for i, rank_eqs in enumerate(self.RANK_EQUATIONS)))
+            UpsilonGaussians = self.RankEquations(*(self._UpsilonGaussian(G, Phi, Upsilon_cho, rank_eqs) for i, rank_eqs in enumerate(self.RANK_EQUATIONS)))
             OmegaGaussians = self.RankEquations(*(self._OmegaGaussian(m, self.G, self.Phi, self.Upsilon, rank_eqs)
                                                  for i, rank_eqs in enumerate(self.RANK_EQUATIONS)))
             Wmm = (self._W(self._mu_phi_mu(GGaussian, UpsilonGaussians.DIAGONAL, OmegaGaussians.DIAGONAL, self.RANK_EQUATIONS.DIAGONAL),
@@ -380,18 +399,18 @@ class ClosedSobolWithError(ClosedSobol):
         if not self.is_F_diagonal:
             raise NotImplementedError('If the MOGP kernel covariance is not diagonal, the Sobol error calculation is unstable.')
         self.Upsilon = self.Lambda2[-1][2]
-        self.V |= {4: tf.einsum('li, li -> li', self.V[2], self.V[2])}
+        self.Upsilon_cho = tf.sqrt(self.Upsilon)
+        self.V |= {4: self.V[2] * self.V[2]}
         self.mu_phi_mu = {'pre-factor': tf.reshape(tf.sqrt(tf.reduce_prod(self.Lambda2[1][0] * self.Lambda2[-1][2], axis=-1)) * self.F, [-1])}
         self.mu_phi_mu['pre-factor'] = tf.reshape(self.mu_phi_mu['pre-factor'], [-1])
-        self.GGaussian = Gaussian(mean=self.G, variance=self.Phi, is_variance_diagonal=True, LBunch=2)
         self.psi_factor = self._psi_factor(self.G, self.Phi, self.GGaussian)
         if self.meta['is_T_partial']:
-            self.UpsilonGaussians = self._UpsilonGaussian(self.G, self.Phi, self.Upsilon, self.RANK_EQUATIONS.DIAGONAL)
+            self.UpsilonGaussians = self._UpsilonGaussian(self.G, self.Phi, self.Upsilon_cho, self.RANK_EQUATIONS.DIAGONAL)
             self.OmegaGaussians = self._OmegaGaussian(self.Ms, self.G, self.Phi, self.Upsilon, self.RANK_EQUATIONS.DIAGONAL)
             self.W = self._W(self._mu_phi_mu(self.GGaussian, self.UpsilonGaussians, self.OmegaGaussians, self.RANK_EQUATIONS.DIAGONAL),
                              self._mu_psi_mu(self.psi_factor, self.RANK_EQUATIONS.DIAGONAL))
         else:
-            self.UpsilonGaussians = self.RankEquations(*(self._UpsilonGaussian(self.G, self.Phi, self.Upsilon, rank_eq)
+            self.UpsilonGaussians = self.RankEquations(*(self._UpsilonGaussian(self.G, self.Phi, self.Upsilon_cho, rank_eq)
                                                          for i, rank_eq in enumerate(self.RANK_EQUATIONS)))
             self.OmegaGaussians = self.RankEquations(*(self._OmegaGaussian(self.Ms, self.G, self.Phi, self.Upsilon, rank_eq)
                                                        for i, rank_eq in enumerate(self.RANK_EQUATIONS)))
@@ -121,22 +121,14 @@ class GSA(Model):
             method: Not used.
         Returns: The results of the calculation, as a labelled dictionary of tf.Tensors.
         """
-        m_dataset = self._m_dataset
         calibrator = self.calibrator
-        first_iteration = True
-        for m in m_dataset:
-            result = calibrator.marginalize(m)
-            if first_iteration:
-                results = {key: value[..., tf.newaxis] for key, value in result.items()}
-                first_iteration = False
-            else:
-                for key in results.keys():
-                    results[key] = tf.concat([results[key], result[key][..., tf.newaxis]], axis=-1)
+        marginals = [calibrator.marginalize(m) for m in self._m_dataset]
+        results = {key: tf.stack([marginal[key] for marginal in marginals], axis=-1) for key in marginals[0].keys()}
         results = self._post_calibrate(calibrator, results)
         self._compose_and_save(results)
         return self.meta
 
-    def __init__(self, gp: GPR, kind: GSA.Kind, m: int = -1, is_error_calculated: bool = False, **kwargs: Any):
+    def __init__(self, gp: GPR, kind: GSA.Kind, m: int = -1, is_error_calculated: bool = False, calibrator: Calibrator | None = None, **kwargs: Any):
         """ Perform a general GSA. The object created is single use and disposable: the constructor performs and records the entire GSA and the
         constructed object is basically useless once constructed.
 
@@ -147,10 +139,13 @@ class GSA(Model):
                 Any m outside this range results the Sobol index of kind being calculated for all ``m in range(1, M+1)``.
             is_error_calculated: Whether to calculate the standard error on the Sobol index.
                 This is a memory intensive calculation, so leave this flag False unless you are sure you need errors
+            calibrator: The ``calibrator`` of a previous GSA on the same gp, is_error_calculated and kwargs, to reuse rather than reconstruct.
+                This is independent of kind and m. If None, a calibrator is constructed.
             **kwargs: The calculation meta to override META.
         """
         self.gp = gp
         self.is_error_calculated = is_error_calculated
+        self._calibrator = calibrator
         self.kind = kind
         m = m if 0 <= m < gp.M else -1
         name = kind.name.lower() if m == -1 else f'{kind.name.lower()}.{m}'
@@ -200,9 +195,11 @@ class Sobol(GSA):
             gp: The GPR underpinning the GSA.
             is_error_calculated: Whether to calculate the standard error of the GSA
             **kwargs: Options passed straight to the Calibrator.
-        Returns: The Calibrator.
+        Returns: The Calibrator, constructed on first use unless one was supplied to the constructor.
         """
-        return ClosedSobolWithError(self.gp, **self.meta) if self.is_error_calculated else ClosedSobol(self.gp, **self.meta)
+        if self._calibrator is None:
+            self._calibrator = ClosedSobolWithError(self.gp, **self.meta) if self.is_error_calculated else ClosedSobol(self.gp, **self.meta)
+        return self._calibrator
 
     def _post_calibrate(self, calibrator: Calibrator, results: Dict[str, TF.Tensor]) -> Dict[str, TF.Tensor]:
         results['V'] = tf.concat([results['V'], calibrator.V[0][..., tf.newaxis]], axis=-1)
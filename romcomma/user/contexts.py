@@ -67,15 +67,15 @@ def Environment(name: str = '', device: str = '', **kwargs):
         kwargs = kwargs | {'float': 'float64'}
         eager = kwargs.pop('eager', None)
         tf.config.run_functions_eagerly(eager)
-        print(' using GPFlow(' + ', '.join([f'{k}={v!r}' for k, v in kwargs.items()]), end=')')
+        message = ' using GPFlow(' + ', '.join([f'{k}={v!r}' for k, v in kwargs.items()]) + ')'
         device = '/' + device[max(device.rfind('CPU'), device.rfind('GPU')):]
         if len(device) > 3:
             device_manager = tf.device(device)
-            print(f' on {device}', end='')
+            message += f' on {device}'
         else:
             device_manager = Timer()
         implementation_manager = gf.config.as_context(gf.config.Config(**kwargs))
-        print('...')
+        print(message + '...')     # A single write, rather than one per fragment.
         with device_manager:
             with implementation_manager:
                 yield
@@ -27,6 +27,7 @@ from romcomma.base.definitions import *
 from romcomma.base.classes import Data
 from romcomma.data.storage import Repository, Fold
 from shutil import rmtree
+from concurrent.futures import ThreadPoolExecutor
 
 
 def copy(src: Path | str, dst: Path | str) -> Path:
@@ -77,24 +78,25 @@ class Collect:
         if is_existing_deleted:
             rmtree(dst, ignore_errors=True)
         dst.mkdir(mode=0o777, parents=True, exist_ok=True)
-        for csv, read_options in self.csvs.items():
-            is_initial = True
-            results = None
-            for folder, columns in self.folders.items():
-                file = Path(folder) / f'{csv}.csv'
-                if file.exists() or not self.ignore_missing:
-                    result = pd.read_csv(file, **read_options)
-                    for key, value in columns.items():
-                        result.insert(0, key, np.full(result.shape[0], value), True)
-                    if is_initial:
-                        results = result.copy(deep=True)
-                        is_initial = False
-                    else:
-                        results = pd.concat([results, result.copy(deep=True)], axis=0, ignore_index=True)
-            if not (results is None and self.ignore_missing):
-                results.to_csv(dst / f'{csv}.csv', **(self.write_options | kwargs))
+        csvs = {csv: [(Path(folder) / f'{csv}.csv', columns) for folder, columns in self.folders.items()] for csv in self.csvs}
+        csvs = {csv: [(file, columns) for file, columns in files if not self.ignore_missing or file.exists()] for csv, files in csvs.items()}
+        with ThreadPoolExecutor(max_workers=max(1, min(32, sum(len(files) for files in csvs.values())))) as executor:   # The reads are I/O bound.
+            csvs = {csv: [executor.submit(self._read, file, columns, self.csvs[csv]) for file, columns in files] for csv, files in csvs.items()}
+            for csv, results in csvs.items():
+                results = [result.result() for result in results]
+                if results or not self.ignore_missing:
+                    results = results[0] if len(results) == 1 else pd.concat(results, axis=0, ignore_index=True)
+                    results.to_csv(dst / f'{csv}.csv', **(self.write_options | kwargs))
         return self
 
+    @staticmethod
+    def _read(file: Path, columns: Dict[str, Any], read_options: Dict[str, Any]) -> pd.DataFrame:
+        """ Read a csv file, inserting ``columns`` from R to L."""
+        result = pd.read_csv(file, **read_options)
+        for key, value in columns.items():
+            result.insert(0, key, np.full(result.shape[0], value), True)
+        return result
+
     def from_folds(self, dst: Repository, is_existing_deleted=False, **kwargs: Any) -> Collect:
         """ Collect ``dst/[self.folders]`` from ``Fold(dst, [k])/[self.folders]`` for ``k in self.Folds``.
 
@@ -105,13 +107,28 @@ class Collect:
 
         Returns: ``self'' for chaining calls.
         """
+        return self.from_folds_multi((self,), dst, is_existing_deleted, **kwargs)[0]
+
+    @staticmethod
+    def from_folds_multi(collects: Sequence[Collect], dst: Repository, is_existing_deleted=False, **kwargs: Any) -> Sequence[Collect]:
+        """ Call ``collect.from_folds(dst, is_existing_deleted, **kwargs)`` for each collect in collects, in order, reading the Folds of dst just once.
+
+        Args:
+            collects: The Collect objects to collect.
+            dst: The destination folder, to house ``[collect.folders]``.
+            is_existing_deleted: Whether to delete and recreate an existing ``dst``.
+            **kwargs:  Write options passed straight to ``pd.to_csv``.
+
+        Returns: ``collects'' for chaining calls.
+        """
         if isinstance(dst, Fold):
             raise NotADirectoryError('dst is a Fold, which cannot contain other Folds, so cannot be Collected from.')
         folds = tuple((Fold(dst, k) for k in dst.folds))
-        for sub_folder, extra_columns in self.folders.items():
-            folders = {fold.folder / sub_folder: {'fold': fold.meta['k'], 'N': fold.N} | extra_columns for fold in folds}
-            Collect(self.csvs, folders, self.ignore_missing).from_folders(dst.folder / sub_folder, is_existing_deleted, **kwargs)
-        return self
+        for collect in collects:
+            for sub_folder, extra_columns in collect.folders.items():
+                folders = {fold.folder / sub_folder: {'fold': fold.meta['k'], 'N': fold.N} | extra_columns for fold in folds}
+                Collect(collect.csvs, folders, collect.ignore_missing).from_folders(dst.folder / sub_folder, is_existing_deleted, **kwargs)
+        return collects
 
     def __init__(self, csvs: Dict[str, Dict[str, Any]] = None, folders: Dict[str, Dict[str, Any]] = None, ignore_missing: bool = False, **kwargs: Any):
         """ Construct a Collect object.
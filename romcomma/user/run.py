@@ -29,13 +29,123 @@ from romcomma.gpr.kernels import Kernel
 from romcomma.gpr.models import GPR, MOGP
 from romcomma.gsa.models import GSA, Sobol
 from romcomma.user import contexts, results
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
 import shutil
 
 
+def _initialize_worker(device_type: str, devices: multiprocessing.Queue):
+    """ Place a worker process on the caller's device type. On GPU, pin the worker to its own GPU, growing its memory on demand so that
+    workers can share a device.
+
+    Args:
+        device_type: The type of device ('CPU' or 'GPU') on which the caller places its operations, e.g. as chosen by ``contexts.Environment``.
+        devices: A queue of worker indices, one of which is taken by each worker.
+    """
+    gpus = tf.config.list_physical_devices('GPU')
+    if device_type == 'CPU':
+        tf.config.set_visible_devices([], 'GPU')
+    elif gpus:
+        gpu = gpus[devices.get() % len(gpus)]
+        tf.config.set_visible_devices(gpu, 'GPU')
+        tf.config.experimental.set_memory_growth(gpu, True)
+
+
+def _over_folds(function: Callable[..., List], name: str, repo: Repository, n_jobs: int | None, *args, **kwargs) -> List:
+    """ Apply ``function(name, Fold(repo, k), *args, **kwargs)`` to every Fold in repo, in parallel if ``n_jobs != 1``.
+
+    Args:
+        function: Either ``_gpr_fold`` or ``_gsa_fold``.
+        name: Passed to function.
+        repo: A Repository containing Folds.
+        n_jobs: The maximum number of worker processes, each handling one Fold at a time. None means ``os.cpu_count()``.
+            Workers are spawned afresh, so they do not inherit any ``contexts.Environment`` of the caller, other than its choice of CPU or GPU.
+        *args: Passed to function.
+        **kwargs: Passed to function.
+    Returns: The names returned by function, which are identical for every Fold.
+    """
+    names = []
+    n_jobs = min((os.cpu_count() or 1) if n_jobs is None else n_jobs, len(repo.folds))
+    if n_jobs > 1:
+        context = multiprocessing.get_context('spawn')
+        devices = context.Queue()
+        for i in range(n_jobs):
+            devices.put(i)
+        device_type = tf.DeviceSpec.from_string(tf.zeros(()).device).device_type    # Where the caller's operations are placed.
+        with ProcessPoolExecutor(n_jobs, context, _initialize_worker, (device_type, devices)) as executor:
+            futures = [executor.submit(function, name, Fold(repo, k), *args, **kwargs) for k in repo.folds]
+            for future in as_completed(futures):
+                names = future.result()
+    else:
+        for k in repo.folds:
+            names = function(name, Fold(repo, k), *args, **kwargs)
+    return names
+
+
+def _variants(is_covariant: bool | None, is_isotropic: bool | None) -> List[Tuple[bool, bool]]:
+    """ The (is_covariant, is_isotropic) pairs to run on a Fold, in order. A None is expanded to run the simpler variant first.
+
+    Args:
+        is_covariant: If None, variant (independent) is run, followed by covariant, which is never isotropic unless is_isotropic is True.
+        is_isotropic: If None, isotropic is run, followed by anisotropic.
+    Returns: A list of (is_covariant, is_isotropic) pairs.
+    """
+    isotropies = (True, False) if is_isotropic is None else (is_isotropic,)
+    if is_covariant is None:
+        return [(False, isotropy) for isotropy in isotropies] + [(True, False if is_isotropic is None else is_isotropic)]
+    return [(is_covariant, isotropy) for isotropy in isotropies]
+
+
+def _gpr(name: str, fold: Fold, is_read: bool | None, is_covariant: bool, is_isotropic: bool, ignore_exceptions: bool,
+         kernel_parameters: Kernel.Data | None, likelihood_variance: NP.Matrix | None, is_calibrated: bool, is_tested: bool, **kwargs) -> str:
+    """ Undertake GPR of a single variant on a Fold. The arguments are as for ``gpr``, except that is_covariant and is_isotropic must not be None.
+
+    Returns: The full name of the MOGP constructed.
+    """
+    full_name = name + ('.c' if is_covariant else '.v') + ('.i' if is_isotropic else '.a')
+    if is_read is None:
+        children = frozenset(entry.name for entry in os.scandir(fold.folder) if entry.is_dir())     # One readdir, rather than a stat per probe.
+        is_read = full_name in children
+        if not is_read:
+            nearest_name = name + '.v' + full_name[-2:]
+            if not (is_covariant and nearest_name in children):
+                nearest_name = full_name[:-2] + '.i'
+            if nearest_name in children:
+                GPR.Data.copy(src_folder=fold.folder / nearest_name, dst_folder=fold.folder / full_name)
+                is_read = True
+    with contexts.Timer(f'fold.{fold.meta["k"]} {full_name} GPR'):
+        try:
+            if is_read:
+                gp = MOGP(full_name, fold, is_read, is_covariant, is_isotropic)
+            else:
+                gp = MOGP(full_name, fold, is_read, is_covariant, is_isotropic, kernel_parameters, likelihood_variance)
+            if is_calibrated:
+                gp.calibrate(**kwargs)
+            if is_tested:
+                gp.test()
+        except BaseException as exception:
+            if not ignore_exceptions:
+                raise exception
+    return full_name
+
+
+def _gpr_fold(name: str, fold: Fold, is_read: bool | None, is_covariant: bool | None, is_isotropic: bool | None, *args, **kwargs) -> List[str]:
+    """ Undertake GPR of every variant on a Fold, in order. The arguments are as for ``gpr``.
+
+    Returns: The full names of the GPs constructed.
+    """
+    names = []
+    for variant in _variants(is_covariant, is_isotropic):
+        names += [_gpr(name, fold, is_read, *variant, *args, **kwargs)]
+        is_read = None  # Every variant after the first is broadcast from its nearest ancestor.
+    return names
+
+
 def gpr(name: str, repo: Repository, is_read: bool | None, is_covariant: bool | None, is_isotropic: bool | None, ignore_exceptions: bool = False,
         kernel_parameters: Kernel.Data | None = None, likelihood_variance: NP.Matrix | None = None,
-        is_calibrated: bool = True, is_tested: bool = True, **kwargs) -> List[str]:
-    """ Undertake GPR on a Fold, or recursively across the Folds in a Repository.
+        is_calibrated: bool = True, is_tested: bool = True, n_jobs: int | None = 1, **kwargs) -> List[str]:
+    """ Undertake GPR on a Fold, or across the Folds in a Repository.
 
     Args:
         name: The MOGP name.
@@ -50,6 +160,8 @@ def gpr(name: str, repo: Repository, is_read: bool | None, is_covariant: bool |
         likelihood_variance: If not None this replaces the likelihood_variance specified by the MOGP default.
         is_calibrated: Whether to is_calibrated each MOGP.
         is_tested: Whether to test_data each MOGP.
+        n_jobs: The maximum number of processes working on Folds in parallel, when repo is not a Fold. None means ``os.cpu_count()``.
+            Each process imports TensorFlow and retraces afresh, which costs several seconds, so this only pays off for large Folds.
         kwargs: A Dict of implementation-dependent passes straight to MOGP.Optimize().
     Returns:
         A list of the names of the GPs which have been constructed. The MOGP.Data are ``user.results.Aggregated`` over folds
@@ -57,56 +169,62 @@ def gpr(name: str, repo: Repository, is_read: bool | None, is_covariant: bool |
         FileNotFoundError: If repo is not a Fold, and contains no Folds.
     """
     if not isinstance(repo, Fold):
-        for k in repo.folds:
-            names = gpr(name, Fold(repo, k), is_read, is_covariant, is_isotropic, ignore_exceptions, kernel_parameters, likelihood_variance, is_calibrated, is_tested, **kwargs)
-        if is_tested:
-            results.Collect({'test': {'header': [0, 1]}, 'test_summary': {'header': [0, 1], 'index_col': 0}},
-                      {name: {} for name in names}, ignore_exceptions).from_folds(repo, True)
-        results.Collect({'variance': {}, 'log_marginal': {}}, {f'{name}/likelihood': {} for name in names}, ignore_exceptions).from_folds(repo, True)
-        results.Collect({'variance': {}, 'lengthscales': {}}, {f'{name}/kernel': {} for name in names}, ignore_exceptions).from_folds(repo, True)
+        names = _over_folds(_gpr_fold, name, repo, n_jobs, is_read, is_covariant, is_isotropic, ignore_exceptions, kernel_parameters, likelihood_variance,
+                            is_calibrated, is_tested, **kwargs)
+        collects = [results.Collect({'test': {'header': [0, 1]}, 'test_summary': {'header': [0, 1], 'index_col': 0}},
+                                    {name: {} for name in names}, ignore_exceptions)] if is_tested else []
+        collects += [results.Collect({'variance': {}, 'log_marginal': {}}, {f'{name}/likelihood': {} for name in names}, ignore_exceptions),
+                     results.Collect({'variance': {}, 'lengthscales': {}}, {f'{name}/kernel': {} for name in names}, ignore_exceptions)]
+        results.Collect.from_folds_multi(collects, repo, True)
         return names
     else:
-        if is_covariant is None:
-            names = gpr(name, repo, is_read, False, is_isotropic, ignore_exceptions, kernel_parameters, likelihood_variance, is_calibrated, is_tested, **kwargs)
-            return (names +
-                    gpr(name, repo, None, True, False if is_isotropic is None else is_isotropic, ignore_exceptions,
-                        kernel_parameters, likelihood_variance, is_calibrated, is_tested, **kwargs))
-        full_name = name + ('.c' if is_covariant else '.v')
-        if is_isotropic is None:
-            names = gpr(name, repo, is_read, is_covariant, True, ignore_exceptions, kernel_parameters, likelihood_variance, is_calibrated, is_tested, **kwargs)
-            return names + gpr(name, repo, None, is_covariant, False, ignore_exceptions, kernel_parameters, likelihood_variance, is_calibrated, is_tested, **kwargs)
-        full_name = full_name + ('.i' if is_isotropic else '.a')
-        if is_read is None:
-            if not (repo.folder / full_name).exists():
-                nearest_name = name + '.v' + full_name[-2:]
-                if not (is_covariant and (repo.folder / nearest_name).exists()):
-                    nearest_name = full_name[:-2] + '.i'
-                    if not (repo.folder / nearest_name).exists():
-                        return gpr(name, repo, False, is_covariant, is_isotropic, ignore_exceptions, kernel_parameters, likelihood_variance,
-                                   is_calibrated, is_tested, **kwargs)
-                GPR.Data.copy(src_folder=repo.folder / nearest_name, dst_folder=repo.folder / full_name)
-            return gpr(name, repo, True, is_covariant, is_isotropic, ignore_exceptions, kernel_parameters, likelihood_variance, is_calibrated, is_tested, **kwargs)
-        with contexts.Timer(f'fold.{repo.meta["k"]} {full_name} GPR'):
-            try:
-                if is_read:
-                    gp = MOGP(full_name, repo, is_read, is_covariant, is_isotropic)
-                else:
-                    gp = MOGP(full_name, repo, is_read, is_covariant, is_isotropic, kernel_parameters, likelihood_variance)
-                if is_calibrated:
-                    gp.calibrate(**kwargs)
-                if is_tested:
-                    gp.test()
-            except BaseException as exception:
-                if not ignore_exceptions:
-                    raise exception
-        return [full_name]
+        return _gpr_fold(name, repo, is_read, is_covariant, is_isotropic, ignore_exceptions, kernel_parameters, likelihood_variance,
+                         is_calibrated, is_tested, **kwargs)
+
+
+def _gsa(name: str, fold: Fold, is_covariant: bool, is_isotropic: bool, kinds: Sequence[GSA.Kind], m: int, ignore_exceptions: bool,
+         is_error_calculated: bool, **kwargs) -> List[Path]:
+    """ Undertake GSA of a single variant on a Fold. The arguments are as for ``gsa``, except that is_covariant and is_isotropic must not be None.
+
+    Returns: The calculation names which have been run, relative to fold.folder.
+    """
+    full_name = name + ('.c' if is_covariant else '.v') + ('.i' if is_isotropic else '.a')
+    names = []
+    if not (fold.folder / full_name).is_dir():     # Fail fast, rather than after constructing a MOGP which cannot be read.
+        if ignore_exceptions:
+            return names
+        raise FileNotFoundError(f'{fold.folder / full_name} does not house a GP.')
+    with contexts.Timer(f'fold.{fold.meta["k"]} {full_name} GSA'):
+        try:
+            gp = MOGP(full_name, fold, is_read=True, is_covariant=is_covariant, is_isotropic=is_isotropic)
+            calibrator = None   # Shared by all kinds, as it depends only on gp and kwargs.
+            for kind in kinds:
+                sobol = Sobol(gp, kind, m, is_error_calculated, calibrator, **kwargs)
+                folder = sobol.calibrate().get('folder')
+                calibrator = sobol.calibrator
+                names += [Path(folder).relative_to(fold.folder)]
+        except BaseException as exception:
+            if not ignore_exceptions:
+                raise exception
+    return names
+
+
+def _gsa_fold(name: str, fold: Fold, is_covariant: bool | None, is_isotropic: bool | None, *args, **kwargs) -> List[Path]:
+    """ Undertake GSA of every variant on a Fold, in order. The arguments are as for ``gsa``.
+
+    Returns: The calculation names which have been run, relative to fold.folder.
+    """
+    names = []
+    for variant in _variants(is_covariant, is_isotropic):
+        names += _gsa(name, fold, *variant, *args, **kwargs)
+    return names
 
 
 def gsa(name: str, repo: Repository, is_covariant: Optional[bool], is_isotropic: Optional[bool],
 
         kinds: GSA.Kind | Sequence[GSA.Kind] = GSA.ALL_KINDS, m: int = -1,
-        ignore_exceptions: bool = False, is_error_calculated: bool = False, **kwargs) -> List[Path]:
-    """ Undertake GSA on a Fold, or recursively across the Folds in a Repository.
+        ignore_exceptions: bool = False, is_error_calculated: bool = False, n_jobs: int | None = 1, **kwargs) -> List[Path]:
+    """ Undertake GSA on a Fold, or across the Folds in a Repository.
 
     Args:
         name: The GSA name.
@@ -120,6 +238,8 @@ def gsa(name: str, repo: Repository, is_covariant: Optional[bool], is_isotropic:
         m: The dimensionality of the reduced model. For a single calculation it is required that ``0 < m < gp.M``.
             Any m outside this range results the Sobol index of each kind being calculated for all ``m in range(1, M+1)``.
         ignore_exceptions: Whether to ignore exceptions (e.g. file not found) when they are encountered, or halt.
+        n_jobs: The maximum number of processes working on Folds in parallel, when repo is not a Fold. None means ``os.cpu_count()``.
+            Each process imports TensorFlow and retraces afresh, which costs several seconds, so this only pays off for large Folds.
         kwargs: A Dict of gsa calculation options, which updates the default gsa.undertake.calculation.META.
     Raises:
         FileNotFoundError: If repo is not a Fold, and contains no Folds.
@@ -128,31 +248,15 @@ def gsa(name: str, repo: Repository, is_covariant: Optional[bool], is_isotropic:
     """
     kinds = (kinds,) if isinstance(kinds, GSA.Kind) else kinds
     if not isinstance(repo, Fold):
-        names = []
-        for k in repo.folds:
-            names = gsa(name, Fold(repo, k), is_covariant, is_isotropic, kinds, m, ignore_exceptions, is_error_calculated, **kwargs)
+        names = _over_folds(_gsa_fold, name, repo, n_jobs, is_covariant, is_isotropic, kinds, m, ignore_exceptions, is_error_calculated, **kwargs)
         results.Collect({'S': {}, 'V': {}} | ({'T': {}, 'W': {}} if is_error_calculated else {}),
                         {name: {} for name in names}, ignore_exceptions).from_folds(repo, True)
+        meta_json = repo.fold_folder(repo.folds.start) / 'meta.json'
         for name in names:
-            shutil.copyfile(repo.fold_folder(repo.folds.start) / 'meta.json', repo.folder / name / 'meta.json')
-    else:
-        if is_covariant is None:
-            names = gsa(name, repo, False, is_isotropic, kinds, m, ignore_exceptions, is_error_calculated, **kwargs)
-            return (names +
-                    gsa(name, repo, True, False if is_isotropic is None else is_isotropic, kinds, m, ignore_exceptions, is_error_calculated, **kwargs))
-        full_name = name + ('.c' if is_covariant else '.v')
-        if is_isotropic is None:
-            names = gsa(name, repo, is_covariant, True, kinds, m, ignore_exceptions, is_error_calculated, **kwargs)
-            return names + gsa(name, repo, is_covariant, False, kinds, m, ignore_exceptions, is_error_calculated, **kwargs)
-        full_name = full_name + ('.i' if is_isotropic else '.a')
-        with contexts.Timer(f'fold.{repo.meta["k"]} {full_name} GSA'):
-            names = []
             try:
-                gp = MOGP(full_name, repo, is_read=True, is_covariant=is_covariant, is_isotropic=is_isotropic)
-                for kind in kinds:
-                    folder = Sobol(gp, kind, m, is_error_calculated, **kwargs).calibrate().get('folder')
-                    names += [Path(folder).relative_to(repo.folder)]
-            except BaseException as exception:
-                if not ignore_exceptions:
-                    raise exception
+                os.link(meta_json, repo.folder / name / 'meta.json')
+            except OSError:     # Across devices, on filesystems without hard links, or where meta.json already exists.
+                shutil.copyfile(meta_json, repo.folder / name / 'meta.json')
+    else:
+        names = _gsa_fold(name, repo, is_covariant, is_isotropic, kinds, m, ignore_exceptions, is_error_calculated, **kwargs)
     return names